@@ -1 +1,16 @@
-from .core import *
+from . import core as _core
+from .core import __all__
+
+
+def __getattr__(name):
+    # Resolve through quantum_lego.core so its lazily imported workflow
+    # builders are only loaded when used.
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_core, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
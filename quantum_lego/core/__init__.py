@@ -177,19 +177,24 @@ Batch stages: multiple parallel calculations with varying parameters
     ...     print(f"{calc_label}: E = {calc_data['energy']} eV")
 """
 
-from .workgraph import (
-    quick_vasp,
-    quick_vasp_batch,
-    quick_vasp_sequential,
-    quick_dos,
-    quick_dos_batch,
-    quick_dos_sequential,
-    quick_hubbard_u,
-    quick_aimd,
-    quick_qe,
-    quick_qe_sequential,
-    get_batch_results_from_workgraph,
-)
+# Workflow builders live behind the lazy workgraph facade, so importing the
+# package for results or status helpers does not load aiida-workgraph,
+# aiida-vasp and the bricks.
+_WORKGRAPH_ATTRS = frozenset({
+    'quick_vasp',
+    'quick_vasp_batch',
+    'quick_vasp_sequential',
+    'make_vasp_sequential_builder',
+    'quick_dos',
+    'quick_dos_batch',
+    'quick_dos_sequential',
+    'quick_hubbard_u',
+    'quick_aimd',
+    'quick_qe',
+    'quick_qe_sequential',
+    'get_batch_results_from_workgraph',
+})
+
 from .results import (
     get_results,
     get_energy,
@@ -226,6 +231,7 @@ __all__ = [
     'quick_vasp',
     'quick_vasp_batch',
     'quick_vasp_sequential',
+    'make_vasp_sequential_builder',
     'quick_dos',
     'quick_dos_batch',
     'quick_dos_sequential',
@@ -261,3 +267,16 @@ __all__ = [
     'DosResults',
     'BatchResults',
 ]
+
+
+def __getattr__(name):
+    if name not in _WORKGRAPH_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from . import workgraph
+    value = getattr(workgraph, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_WORKGRAPH_ATTRS})
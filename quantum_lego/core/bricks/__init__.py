@@ -143,8 +143,10 @@ def resolve_structure_from(structure_from: str, context: dict):
     if ref_stage_type == 'vasp' or ref_stage_type == 'aimd':
         # Static calculations (nsw=0) don't produce a structure output.
         # Fall back to the concrete input_structure stored in stage_tasks.
-        stages = context.get('stages', [])
-        ref_stage_config = next((s for s in stages if s.get('name') == structure_from), {})
+        stage_configs = context.get('stage_configs')
+        if stage_configs is None:
+            stage_configs = {s.get('name'): s for s in context.get('stages', [])}
+        ref_stage_config = stage_configs.get(structure_from, {})
         if ref_stage_config.get('incar', {}).get('nsw', None) == 0:
             return stage_tasks[structure_from]['input_structure']
         return stage_tasks[structure_from]['vasp'].outputs.structure
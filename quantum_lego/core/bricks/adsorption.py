@@ -12,12 +12,12 @@ from typing import Dict, Set, Any
 
 from aiida import orm
 from aiida.common.links import LinkType
-from aiida.plugins import WorkflowFactory
 from aiida_workgraph import task, WorkGraph
 
 from .connections import ADSORPTION_PORTS as PORTS  # noqa: F401
 from ..common.utils import extract_total_energy
 from ..types import StageContext, StageTasksResult
+from ..workflow_utils import _get_task_class
 
 
 # ---------------------------------------------------------------------------
@@ -219,8 +219,7 @@ def create_stage_tasks(
     # ------------------------------------------------------------------ #
     # 3. Build shared VASP input (same INCAR for all 3 SCFs)             #
     # ------------------------------------------------------------------ #
-    VaspWorkChain = WorkflowFactory('vasp.v2.vasp')
-    VaspTask = task(VaspWorkChain)
+    VaspTask = _get_task_class('vasp.v2.vasp')
 
     base_incar = stage['base_incar']
     kpoints_spacing = stage.get('kpoints_spacing', base_kpoints_spacing)
@@ -237,6 +236,7 @@ def create_stage_tasks(
         restart_folder=None,
         clean_workdir=clean_workdir,
         kpoints_mesh=kpoints_mesh,
+        dict_nodes=context.get('dict_nodes'),
     )
 
     # ------------------------------------------------------------------ #
@@ -6,11 +6,11 @@ Multi-stage AIMD is achieved by chaining multiple aimd bricks with restart.
 
 from aiida import orm
 from aiida.common.links import LinkType
-from aiida.plugins import WorkflowFactory
 from aiida_workgraph import task
 
 from .connections import AIMD_PORTS as PORTS  # noqa: F401
 from ..common.utils import extract_total_energy
+from ..workflow_utils import _get_task_class
 
 
 def _looks_fractional_trajectory_positions(positions, cells, tol: float = 0.25) -> bool:
@@ -338,8 +338,7 @@ def create_stage_tasks(wg, stage, stage_name, context):
     i = context['stage_index']
     input_structure = context['input_structure']
 
-    VaspWorkChain = WorkflowFactory('vasp.v2.vasp')
-    VaspTask = task(VaspWorkChain)
+    VaspTask = _get_task_class('vasp.v2.vasp')
 
     # Determine structure source (same auto pattern as VASP brick)
     if 'structure' in stage:
@@ -453,6 +452,7 @@ def create_stage_tasks(wg, stage, stage_name, context):
         restart_folder=None,
         clean_workdir=clean_workdir,
         kpoints_mesh=stage_kpoints_mesh,
+        dict_nodes=context.get('dict_nodes'),
     )
 
     # Ensure parser settings request trajectory output for AIMD.
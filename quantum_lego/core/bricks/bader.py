@@ -57,7 +57,7 @@ def create_stage_tasks(wg, stage, stage_name, context):
     """
     stage_tasks = context['stage_tasks']
     stage_types = context['stage_types']
-    stages = context['stages']
+    stage_configs = context['stage_configs']
 
     charge_from = stage['charge_from']
 
@@ -74,10 +74,7 @@ def create_stage_tasks(wg, stage, stage_name, context):
     # Resolve structure: prefer output structure (from relaxation),
     # fall back to input structure (for SCF with NSW=0)
     charge_from_stage = stage_tasks[charge_from]
-    charge_from_incar = next(
-        (s.get('incar', {}) for s in stages if s['name'] == charge_from),
-        {},
-    )
+    charge_from_incar = stage_configs.get(charge_from, {}).get('incar', {})
     if charge_from_incar.get('nsw', 0) > 0:
         stage_structure = charge_from_stage['vasp'].outputs.structure
     else:
@@ -7,12 +7,12 @@ from typing import Dict, Set, Any
 
 from aiida import orm
 from aiida.common.links import LinkType
-from aiida.plugins import WorkflowFactory
-from aiida_workgraph import task, WorkGraph
+from aiida_workgraph import WorkGraph
 
 from .connections import BATCH_PORTS as PORTS  # noqa: F401
-from ..common.utils import extract_total_energy, deep_merge_dicts
+from ..common.utils import extract_total_energy, merge_incar
 from ..types import StageContext, StageTasksResult, BatchResults
+from ..workflow_utils import _dict_node, _get_task_class
 
 
 def validate_stage(stage: Dict[str, Any], stage_names: Set[str]) -> None:
@@ -66,11 +66,11 @@ def create_stage_tasks(
         Dict with task references for later stages.
     """
     from . import resolve_structure_from
-    from ..workgraph import _prepare_builder_inputs
+    from ..workgraph import _load_code, _prepare_builder_inputs
 
     # Allow per-stage code override via 'code_label' key
     if 'code_label' in stage:
-        code = orm.load_code(stage['code_label'])
+        code = _load_code(stage['code_label'], context.get('codes'))
     else:
         code = context['code']
     potential_family = context['potential_family']
@@ -86,8 +86,7 @@ def create_stage_tasks(
     else:
         input_structure = resolve_structure_from(structure_from, context)
 
-    VaspWorkChain = WorkflowFactory('vasp.v2.vasp')
-    VaspTask = task(VaspWorkChain)
+    VaspTask = _get_task_class('vasp.v2.vasp')
 
     base_incar = stage['base_incar']
 
@@ -119,6 +118,7 @@ def create_stage_tasks(
             restart_folder=None,
             clean_workdir=clean_workdir,
             kpoints_mesh=stage_kpoints_mesh,
+            dict_nodes=context.get('dict_nodes'),
         )
 
         for strain_val in strains:
@@ -157,6 +157,13 @@ def create_stage_tasks(
         # ----------------------------------------------------------------
         calculations = stage['calculations']
 
+        # Builder inputs for calculations that only vary the INCAR are built
+        # once; each such calculation copies them and swaps in its parameters.
+        shared_builder_inputs = None
+        # Equal INCAR/options/mapping/settings dicts share one orm.Dict node,
+        # also with the other stages of the graph
+        dict_nodes = context.get('dict_nodes', {})
+
         for calc_label, calc_config in calculations.items():
             # Per-calc structure override or stage-level
             calc_structure = input_structure
@@ -164,32 +171,46 @@ def create_stage_tasks(
                 explicit = calc_config['structure']
                 calc_structure = orm.load_node(explicit) if isinstance(explicit, int) else explicit
 
-            # Deep-merge base_incar with per-calculation incar overrides
-            calc_incar_overrides = calc_config.get('incar', {})
-            if calc_incar_overrides:
-                merged_incar = deep_merge_dicts(base_incar, calc_incar_overrides)
+            # Merge base_incar with per-calculation incar overrides
+            calc_incar_overrides = calc_config.get('incar')
+            if not calc_incar_overrides:
+                # Only read below, and orm.Dict copies it: no need to copy
+                merged_incar = base_incar
             else:
-                merged_incar = dict(base_incar)
-
-            # Per-calc kpoints or fall back to stage-level
-            calc_kpoints_mesh = calc_config.get('kpoints', stage_kpoints_mesh)
-            calc_kpoints_spacing = calc_config.get('kpoints_spacing', stage_kpoints_spacing)
-
-            # Per-calc retrieve or fall back to stage-level
-            calc_retrieve = calc_config.get('retrieve', stage_retrieve)
+                merged_incar = merge_incar(base_incar, calc_incar_overrides)
 
             # Prepare builder inputs
-            builder_inputs = _prepare_builder_inputs(
-                incar=merged_incar,
-                kpoints_spacing=calc_kpoints_spacing,
-                potential_family=potential_family,
-                potential_mapping=potential_mapping,
-                options=options,
-                retrieve=calc_retrieve,
-                restart_folder=None,
-                clean_workdir=clean_workdir,
-                kpoints_mesh=calc_kpoints_mesh,
-            )
+            if any(k in calc_config for k in ('kpoints', 'kpoints_spacing', 'retrieve')):
+                # Per-calc kpoints/retrieve or fall back to stage-level
+                builder_inputs = _prepare_builder_inputs(
+                    incar=merged_incar,
+                    kpoints_spacing=calc_config.get('kpoints_spacing', stage_kpoints_spacing),
+                    potential_family=potential_family,
+                    potential_mapping=potential_mapping,
+                    options=options,
+                    retrieve=calc_config.get('retrieve', stage_retrieve),
+                    restart_folder=None,
+                    clean_workdir=clean_workdir,
+                    kpoints_mesh=calc_config.get('kpoints', stage_kpoints_mesh),
+                    dict_nodes=dict_nodes,
+                )
+            else:
+                if shared_builder_inputs is None:
+                    shared_builder_inputs = _prepare_builder_inputs(
+                        incar=base_incar,
+                        kpoints_spacing=stage_kpoints_spacing,
+                        potential_family=potential_family,
+                        potential_mapping=potential_mapping,
+                        options=options,
+                        retrieve=stage_retrieve,
+                        restart_folder=None,
+                        clean_workdir=clean_workdir,
+                        kpoints_mesh=stage_kpoints_mesh,
+                        dict_nodes=dict_nodes,
+                    )
+                builder_inputs = dict(shared_builder_inputs)
+                if merged_incar is not base_incar:
+                    builder_inputs['parameters'] = _dict_node({'incar': merged_incar}, dict_nodes)
 
             # Add VASP task
             vasp_task_name = f'vasp_{stage_name}_{calc_label}'
@@ -13,8 +13,7 @@ from typing import Any, Dict, Set
 
 from aiida import orm
 from aiida.common.links import LinkType
-from aiida.plugins import WorkflowFactory
-from aiida_workgraph import task, WorkGraph
+from aiida_workgraph import WorkGraph
 
 from .connections import BIRCH_MURNAGHAN_REFINE_PORTS as PORTS  # noqa: F401
 from ..common.utils import extract_total_energy
@@ -25,6 +24,7 @@ from ..common.eos_tasks import (
     compute_refined_eos_params,
     build_single_refined_structure,
 )
+from ..workflow_utils import _get_task_class
 
 
 def validate_stage(stage: Dict[str, Any], stage_names: Set[str]) -> None:
@@ -151,8 +151,7 @@ def create_stage_tasks(wg, stage, stage_name, context):
     )
 
     # VASP setup
-    VaspWorkChain = WorkflowFactory('vasp.v2.vasp')
-    VaspTask = task(VaspWorkChain)
+    VaspTask = _get_task_class('vasp.v2.vasp')
 
     base_incar = stage['base_incar']
     stage_kpoints_spacing = stage.get('kpoints_spacing', base_kpoints_spacing)
@@ -169,6 +168,7 @@ def create_stage_tasks(wg, stage, stage_name, context):
         restart_folder=None,
         clean_workdir=clean_workdir,
         kpoints_mesh=stage_kpoints_mesh,
+        dict_nodes=context.get('dict_nodes'),
     )
 
     # Create structure + VASP + energy tasks for each refine point
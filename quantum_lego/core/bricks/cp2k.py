@@ -6,9 +6,9 @@ Supports ENERGY, GEO_OPT, CELL_OPT, and MD calculations with restart chaining.
 
 from aiida import orm
 from aiida.common.links import LinkType
-from aiida.plugins import WorkflowFactory
 
 from .connections import CP2K_PORTS as PORTS  # noqa: F401
+from ..workflow_utils import _get_task_class
 
 
 # ---------------------------------------------------------------------------
@@ -110,8 +110,8 @@ def create_stage_tasks(wg, stage: dict, stage_name: str, context: dict) -> dict:
     Returns:
         Dict with 'cp2k', 'energy', 'input_structure' keys pointing to task objects
     """
-    from aiida_workgraph import task
     from ..tasks import extract_cp2k_energy, compute_cp2k_dynamics
+    from ..workgraph import _load_code
     from . import resolve_structure_from
 
     # Resolve structure for this stage
@@ -170,7 +170,7 @@ def create_stage_tasks(wg, stage: dict, stage_name: str, context: dict) -> dict:
     # Get CP2K code
     if 'code_label' in stage:
         code_label = stage['code_label']
-        code = orm.load_code(code_label)
+        code = _load_code(code_label, context.get('codes'))
     else:
         code = context['code']
 
@@ -267,8 +267,7 @@ def create_stage_tasks(wg, stage: dict, stage_name: str, context: dict) -> dict:
         settings['additional_retrieve_list'] = retrieve_list
 
     # Create Cp2kBaseWorkChain task
-    Cp2kBaseWorkChain = WorkflowFactory('cp2k.base')
-    Cp2kTask = task(Cp2kBaseWorkChain)
+    Cp2kTask = _get_task_class('cp2k.base')
 
     cp2k_kwargs = {
         'cp2k__structure': stage_structure,
@@ -24,13 +24,13 @@ from typing import Any, Dict, Set
 
 from aiida import orm
 from aiida.common.links import LinkType
-from aiida.plugins import WorkflowFactory
 from aiida_workgraph import WorkGraph, task
 
 from .connections import DIMER_PORTS as PORTS  # noqa: F401
 from ..common.utils import extract_total_energy
 from ..tasks import compute_dynamics
 from ..types import StageContext, StageTasksResult, VaspResults
+from ..workflow_utils import _get_task_class
 
 
 _MODE_HEADER_RE = re.compile(
@@ -494,8 +494,7 @@ def create_stage_tasks(
     i = context['stage_index']
     input_structure = context['input_structure']
 
-    VaspWorkChain = WorkflowFactory('vasp.v2.vasp')
-    VaspTask = task(VaspWorkChain)
+    VaspTask = _get_task_class('vasp.v2.vasp')
 
     # Determine structure source (same behavior as vasp brick)
     if 'structure' in stage:
@@ -561,14 +560,14 @@ def create_stage_tasks(
         )
         restart_folder = restart_settings['folder']
         if restart_settings['incar_additions']:
-            from ..common.utils import deep_merge_dicts
-            stage['incar'] = deep_merge_dicts(stage['incar'], restart_settings['incar_additions'])
+            from ..common.utils import merge_incar
+            stage['incar'] = merge_incar(stage['incar'], restart_settings['incar_additions'])
         if i == 0 and 'structure' not in stage and stage.get('structure_from') is None:
             stage_structure = restart_structure
 
     # Apply IDM INCAR defaults (user values take precedence)
-    from ..common.utils import deep_merge_dicts
-    stage_incar = deep_merge_dicts(_IDM_INCAR_DEFAULTS, stage['incar'])
+    from ..common.utils import merge_incar
+    stage_incar = merge_incar(_IDM_INCAR_DEFAULTS, stage['incar'])
     stage_kpoints_spacing = stage.get('kpoints_spacing', kpoints_spacing)
     stage_kpoints_mesh = stage.get('kpoints', None)
     stage_retrieve = stage.get('retrieve', None)
@@ -596,6 +595,7 @@ def create_stage_tasks(
             fix_type=stage_fix_type,
             fix_thickness=stage_fix_thickness,
             fix_elements=stage_fix_elements,
+            dict_nodes=context.get('dict_nodes'),
         )
     else:
         builder_inputs = _prepare_builder_inputs(
@@ -608,6 +608,7 @@ def create_stage_tasks(
             restart_folder=None,
             clean_workdir=clean_workdir,
             kpoints_mesh=stage_kpoints_mesh,
+            dict_nodes=context.get('dict_nodes'),
         )
 
     # If fix_type is set and structure is a socket, compute dynamics at runtime
@@ -7,11 +7,11 @@ from typing import Dict, Set, Any
 
 from aiida import orm
 from aiida.common.links import LinkType
-from aiida.plugins import WorkflowFactory
-from aiida_workgraph import task, WorkGraph
+from aiida_workgraph import WorkGraph
 from .connections import DOS_PORTS as PORTS  # noqa: F401
 from ..retrieve_defaults import build_vasp_retrieve
 from ..types import StageContext, StageTasksResult, DosResults
+from ..workflow_utils import _get_task_class, _kpoints_mesh_node
 
 
 def validate_stage(stage: Dict[str, Any], stage_names: Set[str]) -> None:
@@ -89,8 +89,7 @@ def create_stage_tasks(
         input_structure = resolve_structure_from(structure_from, context)
 
     # Get BandsWorkChain and wrap as task
-    BandsWorkChain = WorkflowFactory('vasp.v2.bands')
-    BandsTask = task(BandsWorkChain)
+    BandsTask = _get_task_class('vasp.v2.bands')
 
     # Handle SCF k-points: explicit mesh or spacing
     scf_kpoints_mesh = stage.get('kpoints', None)
@@ -134,9 +133,7 @@ def create_stage_tasks(
 
     # SCF k-points
     if scf_kpoints_mesh is not None:
-        scf_kpoints = orm.KpointsData()
-        scf_kpoints.set_kpoints_mesh(scf_kpoints_mesh)
-        scf_input['kpoints'] = scf_kpoints
+        scf_input['kpoints'] = _kpoints_mesh_node(scf_kpoints_mesh, context.get('dict_nodes'))
     else:
         scf_input['kpoints_spacing'] = float(scf_kpoints_spacing)
 
@@ -152,9 +149,7 @@ def create_stage_tasks(
 
     # DOS k-points
     if dos_kpoints_mesh is not None:
-        dos_kpoints = orm.KpointsData()
-        dos_kpoints.set_kpoints_mesh(dos_kpoints_mesh)
-        dos_input['kpoints'] = dos_kpoints
+        dos_input['kpoints'] = _kpoints_mesh_node(dos_kpoints_mesh, context.get('dict_nodes'))
         band_settings = orm.Dict({
             'only_dos': True,
             'run_dos': True,
@@ -17,6 +17,7 @@ from aiida_workgraph import task, dynamic, namespace, get_current_graph
 
 from .connections import DYNAMIC_BATCH_PORTS as PORTS  # noqa: F401
 from ..common.utils import extract_max_jobs_value, extract_total_energy
+from ..workflow_utils import _get_task_class
 
 
 @task.graph
@@ -40,8 +41,6 @@ def run_dynamic_batch(
     ),
 ]:
     """Relax all structures in parallel using scatter-gather pattern."""
-    from aiida.plugins import WorkflowFactory
-
     from ..workgraph import _prepare_builder_inputs
 
     # Set max_number_jobs on this sub-graph (WorkGraph does not inherit this).
@@ -51,8 +50,7 @@ def run_dynamic_batch(
 
     code = orm.load_node(code_pk)
 
-    VaspWorkChain = WorkflowFactory('vasp.v2.vasp')
-    VaspTask = task(VaspWorkChain)
+    VaspTask = _get_task_class('vasp.v2.vasp')
 
     # Shared builder inputs for all calculations
     builder_inputs = _prepare_builder_inputs(
@@ -28,6 +28,7 @@ from aiida_workgraph import get_current_graph, namespace, task
 
 from .connections import FUKUI_DYNAMIC_PORTS as PORTS  # noqa: F401
 from ..common.utils import extract_max_jobs_value
+from ..workflow_utils import _get_task_class
 
 
 # ---------------------------------------------------------------------------
@@ -107,8 +108,6 @@ def run_fukui_batch(
     so that each ``fukui_analysis`` stage receives a self-contained set of
     four retrieved folders with a consistent reference.
     """
-    from aiida.plugins import WorkflowFactory
-
     from ..workgraph import _prepare_builder_inputs
 
     if max_number_jobs is not None:
@@ -116,8 +115,7 @@ def run_fukui_batch(
         wg.max_number_jobs = extract_max_jobs_value(max_number_jobs)
 
     code = orm.load_node(code_pk)
-    VaspWorkChain = WorkflowFactory('vasp.v2.vasp')
-    VaspTask = task(VaspWorkChain)
+    VaspTask = _get_task_class('vasp.v2.vasp')
 
     results: dict[str, t.Any] = {}
     for group, label, offset in _FUKUI_CALCS:
@@ -241,6 +241,7 @@ def create_stage_tasks(wg, stage, stage_name, context):
             retrieve=['OUTCAR'],
             restart_folder=None,
             clean_workdir=clean_workdir,
+            dict_nodes=context.get('dict_nodes'),
         )
         if 'settings' in nscf_builder_inputs:
             existing = nscf_builder_inputs['settings'].get_dict()
@@ -294,6 +295,7 @@ def create_stage_tasks(wg, stage, stage_name, context):
             retrieve=['OUTCAR'],
             restart_folder=None,
             clean_workdir=clean_workdir,
+            dict_nodes=context.get('dict_nodes'),
         )
         if 'settings' in scf_builder_inputs:
             existing = scf_builder_inputs['settings'].get_dict()
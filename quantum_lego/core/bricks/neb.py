@@ -425,6 +425,7 @@ def create_stage_tasks(wg, stage, stage_name, context):
         restart_folder=None,
         clean_workdir=context['clean_workdir'],
         kpoints_mesh=stage_kpoints_mesh,
+        dict_nodes=context.get('dict_nodes'),
     )
     kpoints_task = None
     if 'kpoints' not in builder_inputs and 'kpoints_spacing' in builder_inputs:
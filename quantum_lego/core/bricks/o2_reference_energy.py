@@ -26,11 +26,11 @@ import typing as t
 
 from aiida import orm
 from aiida.common.links import LinkType
-from aiida.plugins import WorkflowFactory
 from aiida_workgraph import WorkGraph, task
 
 from .connections import O2_REFERENCE_ENERGY_PORTS as PORTS  # noqa: F401
 from ..common.utils import extract_total_energy
+from ..workflow_utils import _get_task_class
 
 # Constants from the o2_dft.tex derivation (298.15 K, 1 bar)
 WATER_SPLITTING_DELTA_G_EXP_EV = 4.92
@@ -164,8 +164,7 @@ def create_stage_tasks(wg: WorkGraph, stage: dict, stage_name: str, context: dic
     kpoints_spacing = stage.get('kpoints_spacing', base_kpoints_spacing)
     retrieve = stage.get('retrieve', None)
 
-    VaspWorkChain = WorkflowFactory('vasp.v2.vasp')
-    VaspTask = task(VaspWorkChain)
+    VaspTask = _get_task_class('vasp.v2.vasp')
 
     # --- H2 ---
     h2_structure = _load_structure(stage['h2_structure'])
@@ -179,6 +178,7 @@ def create_stage_tasks(wg: WorkGraph, stage: dict, stage_name: str, context: dic
         restart_folder=None,
         clean_workdir=clean_workdir,
         kpoints_mesh=kpoints_mesh,
+        dict_nodes=context.get('dict_nodes'),
     )
     h2_vasp = wg.add_task(
         VaspTask,
@@ -206,6 +206,7 @@ def create_stage_tasks(wg: WorkGraph, stage: dict, stage_name: str, context: dic
         restart_folder=None,
         clean_workdir=clean_workdir,
         kpoints_mesh=kpoints_mesh,
+        dict_nodes=context.get('dict_nodes'),
     )
     h2o_vasp = wg.add_task(
         VaspTask,
@@ -8,11 +8,11 @@ from typing import Dict, Set, Any
 
 from aiida import orm
 from aiida.common.links import LinkType
-from aiida.plugins import WorkflowFactory
 from aiida_workgraph import WorkGraph
 
 from .connections import QE_PORTS as PORTS  # noq: F401
 from ..types import StageContext, StageTasksResult
+from ..workflow_utils import _get_task_class, _kpoints_mesh_node
 
 
 # ---------------------------------------------------------------------------
@@ -75,8 +75,8 @@ def create_stage_tasks(
     Returns:
         Dict with 'qe', 'energy', 'input_structure' keys pointing to task objects
     """
-    from aiida_workgraph import task
     from ..tasks import extract_qe_energy
+    from ..workgraph import _load_code
     from . import resolve_structure_from
 
     # Resolve structure for this stage following the auto(previous)/input/'stage_name' pattern
@@ -112,7 +112,7 @@ def create_stage_tasks(
     # Get QE code
     if 'code_label' in stage:
         code_label = stage['code_label']
-        code = orm.load_code(code_label)
+        code = _load_code(code_label, context.get('codes'))
     else:
         code = context['code']
 
@@ -130,11 +130,23 @@ def create_stage_tasks(
         raise ImportError("aiida-pseudo is required for QE calculations. "
                           "Install with: pip install aiida-pseudo")
 
-    pseudo_family = orm.load_group(pseudo_family_name)
-    if not hasattr(pseudo_family, 'get_pseudos'):
-        raise ValueError(f"Group '{pseudo_family_name}' is not a PseudoPotentialFamily")
+    # Stages on a structure node with the same kinds share one lookup (the
+    # build's context['pseudos'] cache); chained output sockets are resolved
+    # per stage as before.
+    pseudos_cache = context.get('pseudos')
+    pseudos_key = None
+    if pseudos_cache is not None and isinstance(stage_structure, orm.StructureData):
+        pseudos_key = (pseudo_family_name, tuple(sorted(stage_structure.get_kind_names())))
+    pseudos = pseudos_cache.get(pseudos_key) if pseudos_key is not None else None
 
-    pseudos = pseudo_family.get_pseudos(structure=stage_structure)
+    if pseudos is None:
+        pseudo_family = orm.load_group(pseudo_family_name)
+        if not hasattr(pseudo_family, 'get_pseudos'):
+            raise ValueError(f"Group '{pseudo_family_name}' is not a PseudoPotentialFamily")
+
+        pseudos = pseudo_family.get_pseudos(structure=stage_structure)
+        if pseudos_key is not None:
+            pseudos_cache[pseudos_key] = pseudos
 
     # Get parameters
     parameters = stage['parameters']
@@ -149,8 +161,7 @@ def create_stage_tasks(
     if 'kpoints' in stage:
         # Explicit k-points mesh [nx, ny, nz]
         kpoints_mesh = stage['kpoints']
-        kpoints = orm.KpointsData()
-        kpoints.set_kpoints_mesh(kpoints_mesh)
+        kpoints = _kpoints_mesh_node(kpoints_mesh, context.get('dict_nodes'))
         kpoints_arg = {'pw__kpoints': kpoints}
     else:
         # Use kpoints_distance (spacing)
@@ -175,8 +186,7 @@ def create_stage_tasks(
     clean_workdir = context.get('clean_workdir', False)
 
     # Create PwBaseWorkChain task
-    PwBaseWorkChain = WorkflowFactory('quantumespresso.pw.base')
-    QeTask = task(PwBaseWorkChain)
+    QeTask = _get_task_class('quantumespresso.pw.base')
 
     qe_kwargs = {
         'pw__structure': stage_structure,
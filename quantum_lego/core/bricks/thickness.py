@@ -13,6 +13,7 @@ Two input modes:
 
 from aiida.common.links import LinkType
 from .connections import THICKNESS_PORTS as PORTS
+from ..workflow_utils import _get_task_class
 
 
 def validate_stage(stage: dict, stage_names: set) -> None:
@@ -140,8 +141,6 @@ def create_stage_tasks(wg, stage, stage_name, context):
         Dict with task references for later stages.
     """
     from aiida import orm
-    from aiida.plugins import WorkflowFactory
-    from aiida_workgraph import task as wg_task
 
     from quantum_lego.core.common.convergence import (
         extract_total_energy,
@@ -165,8 +164,7 @@ def create_stage_tasks(wg, stage, stage_name, context):
         # Mode B: standalone — use initial structure and run bulk relax
         bulk_input = context['input_structure']
 
-        VaspWorkChain = WorkflowFactory('vasp.v2.vasp')
-        VaspTask = wg_task(VaspWorkChain)
+        VaspTask = _get_task_class('vasp.v2.vasp')
 
         bulk_incar = stage.get('bulk_incar', {})
         bulk_kpoints = stage.get('bulk_kpoints_spacing',
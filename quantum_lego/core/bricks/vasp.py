@@ -7,13 +7,13 @@ from typing import Dict, Set, Any
 
 from aiida import orm
 from aiida.common.links import LinkType
-from aiida.plugins import WorkflowFactory
-from aiida_workgraph import task, WorkGraph
+from aiida_workgraph import WorkGraph
 
 from .connections import VASP_PORTS as PORTS  # noqa: F401
 from ..common.utils import extract_total_energy
 from ..tasks import compute_dynamics
 from ..types import StageContext, StageTasksResult, VaspResults
+from ..workflow_utils import _get_task_class
 
 
 # Recommended INCAR defaults for vibrational analysis (IBRION=5) stages.
@@ -154,11 +154,11 @@ def create_stage_tasks(
         Dict with task references for later stages.
     """
     from quantum_lego.core.common.aimd.tasks import create_supercell
-    from ..workgraph import _prepare_builder_inputs
+    from ..workgraph import _load_code, _prepare_builder_inputs
 
     # Allow per-stage code override via 'code_label' key
     if 'code_label' in stage:
-        code = orm.load_code(stage['code_label'])
+        code = _load_code(stage['code_label'], context.get('codes'))
     else:
         code = context['code']
     potential_family = context['potential_family']
@@ -172,8 +172,7 @@ def create_stage_tasks(
     i = context['stage_index']
     input_structure = context['input_structure']
 
-    VaspWorkChain = WorkflowFactory('vasp.v2.vasp')
-    VaspTask = task(VaspWorkChain)
+    VaspTask = _get_task_class('vasp.v2.vasp')
 
     # Determine structure source
     if 'structure' in stage:
@@ -241,8 +240,8 @@ def create_stage_tasks(
         )
         restart_folder = restart_settings['folder']
         if restart_settings['incar_additions']:
-            from ..common.utils import deep_merge_dicts
-            stage['incar'] = deep_merge_dicts(stage['incar'], restart_settings['incar_additions'])
+            from ..common.utils import merge_incar
+            stage['incar'] = merge_incar(stage['incar'], restart_settings['incar_additions'])
         # Use restart structure if no explicit structure source
         if i == 0 and 'structure' not in stage and stage.get('structure_from') is None:
             stage_structure = restart_structure
@@ -251,8 +250,8 @@ def create_stage_tasks(
     # Apply vibrational defaults when IBRION=5 (user values take precedence)
     raw_incar = stage['incar']
     if int(raw_incar.get('ibrion', -1)) == 5:
-        from ..common.utils import deep_merge_dicts
-        stage_incar = deep_merge_dicts(_VIB_INCAR_DEFAULTS, raw_incar)
+        from ..common.utils import merge_incar
+        stage_incar = merge_incar(_VIB_INCAR_DEFAULTS, raw_incar)
     else:
         stage_incar = raw_incar
     stage_kpoints_spacing = stage.get('kpoints_spacing', kpoints_spacing)
@@ -288,6 +287,7 @@ def create_stage_tasks(
             fix_type=stage_fix_type,
             fix_thickness=stage_fix_thickness,
             fix_elements=stage_fix_elements,
+            dict_nodes=context.get('dict_nodes'),
         )
     else:
         builder_inputs = _prepare_builder_inputs(
@@ -300,6 +300,7 @@ def create_stage_tasks(
             restart_folder=None,
             clean_workdir=clean_workdir,
             kpoints_mesh=stage_kpoints_mesh,
+            dict_nodes=context.get('dict_nodes'),
         )
 
     # If fix_type is set and structure is a socket, compute dynamics at runtime
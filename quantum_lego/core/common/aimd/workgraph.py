@@ -7,6 +7,7 @@ from .utils import (
     validate_supercell_spec,
 )
 from .tasks import create_supercell
+from ...workflow_utils import _load_code
 
 
 def build_aimd_workgraph(
@@ -187,7 +188,7 @@ def build_aimd_workgraph(
             base_incar = {}
 
         # Load code
-        code = orm.load_code(code_label)
+        code = _load_code(code_label)
 
         # Create stage task
         stage_task = wg.add_task(
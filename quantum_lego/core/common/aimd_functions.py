@@ -7,10 +7,10 @@ Sequential AIMD stages with automatic restart chaining.
 
 import typing as t
 from aiida import orm
-from aiida.plugins import WorkflowFactory
 from aiida_workgraph import task, dynamic, namespace
 from quantum_lego.core.common.utils import extract_total_energy
 from quantum_lego.core.common.utils import get_vasp_parser_settings, extract_max_jobs_value
+from quantum_lego.core.workflow_utils import _get_task_class
 
 
 def get_settings():
@@ -91,11 +91,8 @@ def _aimd_single_stage_scatter_impl(
     Internal implementation of AIMD single stage scatter.
     This is the actual logic without @task.graph decorator.
     """
-    from aiida.plugins import WorkflowFactory
-    
     # Get VASP workchain
-    VaspWorkChain = WorkflowFactory('vasp.v2.vasp')
-    VaspTask = task(VaspWorkChain)
+    VaspTask = _get_task_class('vasp.v2.vasp')
 
     structures_out = {}
     remote_folders_out = {}
@@ -193,8 +190,7 @@ def aimd_single_stage_scatter(
         wg.max_number_jobs = max_jobs_value
 
     # Get VASP workchain
-    VaspWorkChain = WorkflowFactory('vasp.v2.vasp')
-    VaspTask = task(VaspWorkChain)
+    VaspTask = _get_task_class('vasp.v2.vasp')
 
     structures_out = {}
     remote_folders_out = {}
@@ -10,7 +10,6 @@ import logging
 import typing as t
 
 from aiida import orm
-from aiida.plugins import WorkflowFactory
 from aiida_workgraph import WorkGraph, task, get_current_graph
 
 from .config import DEFAULT_CONV_SETTINGS
@@ -26,6 +25,7 @@ from ..utils import (
     get_vasp_parser_settings,
     extract_max_jobs_value,
 )
+from ...workflow_utils import _get_task_class, _load_code
 
 logger = logging.getLogger(__name__)
 
@@ -139,8 +139,7 @@ def convergence_scan(
     kspacing_list = _build_kspacing_list(settings_dict)
 
     code = orm.load_node(code_pk)
-    VaspWorkChain = WorkflowFactory('vasp.v2.vasp')
-    VaspTask = task(VaspWorkChain)
+    VaspTask = _get_task_class('vasp.v2.vasp')
     parser_settings = orm.Dict(dict=get_vasp_parser_settings(add_energy=True))
 
     # ── Cutoff convergence scans ──────────────────────────────────────
@@ -330,7 +329,7 @@ def build_convergence_workgraph(
     logger.info(f"Building convergence WorkGraph: {name}")
 
     # Load code
-    code = orm.load_code(code_label)
+    code = _load_code(code_label)
     logger.info(f"  Using code: {code_label}")
 
     # Merge conv_settings with defaults
@@ -11,13 +11,13 @@ import os
 import typing as t
 
 from aiida import orm
-from aiida.plugins import WorkflowFactory
 from aiida_workgraph import WorkGraph, task, dynamic, namespace, get_current_graph
 
 from .utils import _load_structure_from_file, _get_thickness_settings
 from .slabs import generate_thickness_series
 from ..constants import EV_PER_ANGSTROM2_TO_J_PER_M2
 from ..utils import extract_max_jobs_value, extract_total_energy
+from ...workflow_utils import _get_task_class, _load_code
 
 logger = logging.getLogger(__name__)
 
@@ -63,8 +63,7 @@ def relax_thickness_series(
         wg.max_number_jobs = max_jobs_value
 
     # Get VASP workchain
-    VaspWorkChain = WorkflowFactory('vasp.v2.vasp')
-    VaspTask = task(VaspWorkChain)
+    VaspTask = _get_task_class('vasp.v2.vasp')
 
     # Load code from PK
     code = orm.load_node(code_pk)
@@ -414,12 +413,11 @@ def build_thickness_convergence_workgraph(
         logger.info(f"  Loaded structure from: {bulk_structure_path}")
 
     # Load code
-    code = orm.load_code(code_label)
+    code = _load_code(code_label)
     logger.info(f"  Using code: {code_label}")
 
     # Get VASP workchain
-    VaspWorkChain = WorkflowFactory('vasp.v2.vasp')
-    VaspTask = task(VaspWorkChain)
+    VaspTask = _get_task_class('vasp.v2.vasp')
 
     # Build workflow
     wg = WorkGraph(name=name)
@@ -16,8 +16,7 @@ Reference: https://www.vasp.at/wiki/index.php/Calculate_U_for_LSDA+U
 import typing as t
 
 from aiida import orm
-from aiida.plugins import WorkflowFactory
-from aiida_workgraph import WorkGraph, task
+from aiida_workgraph import WorkGraph
 
 from ..utils import get_vasp_parser_settings
 from .tasks import (
@@ -34,6 +33,7 @@ from .utils import (
     get_species_order_from_structure,
     DEFAULT_POTENTIAL_VALUES,
 )
+from ...workflow_utils import _get_task_class, _load_code
 
 
 def build_u_calculation_workgraph(
@@ -126,9 +126,8 @@ def build_u_calculation_workgraph(
     all_species = get_species_order_from_structure(structure)
 
     # Load VASP code and wrap as task
-    code = orm.load_code(code_label)
-    VaspWorkChain = WorkflowFactory('vasp.v2.vasp')
-    VaspTask = task(VaspWorkChain)
+    code = _load_code(code_label)
+    VaspTask = _get_task_class('vasp.v2.vasp')
 
     # Get parser settings that request orbital data
     settings = get_vasp_parser_settings(
@@ -138,6 +137,12 @@ def build_u_calculation_workgraph(
         add_kpoints=True,
     )
 
+    # Values shared by the ground state and every response task, built once
+    lmaxmix = 4 if ldaul == 2 else 6  # 4 for d, 6 for f electrons
+    options_node = orm.Dict(dict=options)
+    potential_mapping_node = orm.Dict(dict=potential_mapping)
+    settings_node = orm.Dict(dict=settings)
+
     # Create WorkGraph
     wg = WorkGraph(name=name)
 
@@ -146,7 +151,7 @@ def build_u_calculation_workgraph(
     # =========================================================================
     gs_incar = prepare_ground_state_incar(
         base_params=ground_state_parameters,
-        lmaxmix=4 if ldaul == 2 else 6,  # 4 for d, 6 for f electrons
+        lmaxmix=lmaxmix,
     )
 
     ground_state = wg.add_task(
@@ -155,12 +160,12 @@ def build_u_calculation_workgraph(
         structure=structure,
         code=code,
         parameters=orm.Dict(dict={'incar': gs_incar}),
-        options=orm.Dict(dict=options),
+        options=options_node,
         potential_family=potential_family,
-        potential_mapping=orm.Dict(dict=potential_mapping),
+        potential_mapping=potential_mapping_node,
         kpoints_spacing=kpoints_spacing,
         clean_workdir=False,  # MUST keep CHGCAR/WAVECAR
-        settings=orm.Dict(dict=settings),
+        settings=settings_node,
     )
 
     # Extract ground state d-electron occupation
@@ -190,7 +195,7 @@ def build_u_calculation_workgraph(
             ldaul=ldaul,
             ldauj=ldauj,
             is_scf=False,  # ICHARG=11
-            lmaxmix=4 if ldaul == 2 else 6,
+            lmaxmix=lmaxmix,
         )
 
         nscf_task = wg.add_task(
@@ -199,13 +204,13 @@ def build_u_calculation_workgraph(
             structure=structure,
             code=code,
             parameters=orm.Dict(dict={'incar': nscf_incar}),
-            options=orm.Dict(dict=options),
+            options=options_node,
             potential_family=potential_family,
-            potential_mapping=orm.Dict(dict=potential_mapping),
+            potential_mapping=potential_mapping_node,
             kpoints_spacing=kpoints_spacing,
             restart_folder=ground_state.outputs.remote_folder,
             clean_workdir=clean_workdir,
-            settings=orm.Dict(dict=settings),
+            settings=settings_node,
         )
 
         # Extract NSCF d-occupation
@@ -226,7 +231,7 @@ def build_u_calculation_workgraph(
             ldaul=ldaul,
             ldauj=ldauj,
             is_scf=True,  # No ICHARG
-            lmaxmix=4 if ldaul == 2 else 6,
+            lmaxmix=lmaxmix,
         )
 
         scf_task = wg.add_task(
@@ -235,13 +240,13 @@ def build_u_calculation_workgraph(
             structure=structure,
             code=code,
             parameters=orm.Dict(dict={'incar': scf_incar}),
-            options=orm.Dict(dict=options),
+            options=options_node,
             potential_family=potential_family,
-            potential_mapping=orm.Dict(dict=potential_mapping),
+            potential_mapping=potential_mapping_node,
             kpoints_spacing=kpoints_spacing,
             restart_folder=ground_state.outputs.remote_folder,
             clean_workdir=clean_workdir,
-            settings=orm.Dict(dict=settings),
+            settings=settings_node,
         )
 
         # Extract SCF d-occupation
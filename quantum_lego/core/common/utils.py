@@ -139,6 +139,31 @@ def deep_merge_dicts(base: dict, override: dict) -> dict:
     return result
 
 
+def merge_incar(base: dict, override: dict) -> dict:
+    """
+    Merge INCAR overrides into a base INCAR.
+
+    INCAR overrides are almost always flat (tag -> value), for which a
+    shallow merge gives the same result as ``deep_merge_dicts`` without
+    copying every value of the base. Overrides containing nested dicts fall
+    back to ``deep_merge_dicts``.
+
+    Args:
+        base: Base INCAR dict
+        override: INCAR tags to set (values take precedence)
+
+    Returns:
+        Merged dictionary (new dict, inputs are not modified). In the flat
+        case non-scalar values such as MAGMOM lists are shared with the
+        inputs, so replace rather than mutate them.
+    """
+    if not override:
+        return dict(base)
+    if any(isinstance(value, dict) for value in override.values()):
+        return deep_merge_dicts(base, override)
+    return {**base, **override}
+
+
 def get_vasp_parser_settings(
     add_energy: bool = True,
     add_trajectory: bool = True,
@@ -5,14 +5,17 @@ through ``quick_vasp_sequential`` and the DOS brick system, while
 ``quick_dos_batch`` keeps a dedicated parallel implementation.
 """
 
+import json
 import typing as t
 
 from aiida import orm
-from aiida.plugins import WorkflowFactory
-from aiida_workgraph import WorkGraph, task
+from aiida_workgraph import WorkGraph
 
-from .common.utils import deep_merge_dicts
+from .common.utils import merge_incar
 from .workflow_utils import (
+    _get_task_class,
+    _load_code,
+    _load_structures,
     _prepare_builder_inputs,
     _wait_for_completion,
 )
@@ -299,6 +302,8 @@ def quick_dos_batch(
 
     Note:
         AiiDA-VASP requires lowercase INCAR keys (e.g., 'encut' not 'ENCUT').
+        Keys that pass the same structure node with the same SCF INCAR share
+        a single SCF task; each key still gets its own DOS task.
 
     Exposed Outputs:
         For each structure key, the following outputs are exposed on the WorkGraph:
@@ -321,19 +326,22 @@ def quick_dos_batch(
     if options is None:
         raise ValueError("options is required - specify scheduler resources")
 
+    # Plain dicts, set once: potential_mapping reaches _dict_node, which can
+    # only key (and so share across tasks) JSON-serialisable content
     if scf_incar_overrides is None:
         scf_incar_overrides = {}
     if dos_incar_overrides is None:
         dos_incar_overrides = {}
+    if potential_mapping is None:
+        potential_mapping = {}
 
     # Default DOS k-points spacing to 80% of SCF spacing (denser)
     if dos_kpoints_spacing is None:
         dos_kpoints_spacing = kpoints_spacing * 0.8
 
     # Load code and wrap VaspWorkChain as task
-    code = orm.load_code(code_label)
-    VaspWorkChain = WorkflowFactory('vasp.v2.vasp')
-    VaspTask = task(VaspWorkChain)
+    code = _load_code(code_label)
+    VaspTask = _get_task_class('vasp.v2.vasp')
 
     # Build WorkGraph
     wg = WorkGraph(name=name)
@@ -343,65 +351,62 @@ def quick_dos_batch(
 
     # Track task names for each key
     task_map = {}
+    # SCF tasks by (structure, SCF INCAR, k-points), shared by duplicate inputs
+    scf_tasks = {}
+    # Equal INCAR/options/mapping/settings dicts share one orm.Dict node
+    dict_nodes = {}
+
+    # Load every structure given as a PK in one query
+    structure_nodes = _load_structures(structures)
+
+    # Finalise the base INCARs once; they are only read from here on
+    base_scf_incar_final = _dos_batch_scf_incar(scf_incar)
+    base_dos_incar_final = _dos_batch_dos_incar(dos_incar)
 
     # Process each structure
-    for key, struct_input in structures.items():
-        # Load structure if PK
-        if isinstance(struct_input, int):
-            struct = orm.load_node(struct_input)
-        else:
-            struct = struct_input
+    for key, struct in structure_nodes.items():
 
-        # Merge base INCAR with per-structure overrides
-        if key in scf_incar_overrides:
-            merged_scf_incar = deep_merge_dicts(scf_incar, scf_incar_overrides[key])
+        # Structures without (or with empty) overrides share the INCARs
+        # finalised above and skip the merge entirely
+        scf_override = scf_incar_overrides.get(key)
+        if scf_override:
+            scf_incar_final = _dos_batch_scf_incar(merge_incar(scf_incar, scf_override))
         else:
-            merged_scf_incar = dict(scf_incar)
+            scf_incar_final = base_scf_incar_final
 
-        if key in dos_incar_overrides:
-            merged_dos_incar = deep_merge_dicts(dos_incar, dos_incar_overrides[key])
+        dos_override = dos_incar_overrides.get(key)
+        if dos_override:
+            dos_incar_final = _dos_batch_dos_incar(merge_incar(dos_incar, dos_override))
         else:
-            merged_dos_incar = dict(dos_incar)
-
-        # Prepare SCF INCAR - force lwave and lcharg for DOS restart
-        scf_incar_final = dict(merged_scf_incar)
-        scf_incar_final['lwave'] = True
-        scf_incar_final['lcharg'] = True
-        if 'nsw' not in scf_incar_final:
-            scf_incar_final['nsw'] = 0
-        if 'ibrion' not in scf_incar_final:
-            scf_incar_final['ibrion'] = -1
-
-        # Prepare DOS INCAR
-        # Note: Don't set ISTART/ICHARG - the restart.folder mechanism in
-        # VaspWorkChain handles WAVECAR/CHGCAR copying automatically
-        dos_incar_final = dict(merged_dos_incar)
-        if 'nsw' not in dos_incar_final:
-            dos_incar_final['nsw'] = 0
-        if 'ibrion' not in dos_incar_final:
-            dos_incar_final['ibrion'] = -1
-
-        # Prepare SCF builder inputs
-        scf_builder_inputs = _prepare_builder_inputs(
-            incar=scf_incar_final,
-            kpoints_spacing=kpoints_spacing,
-            potential_family=potential_family,
-            potential_mapping=potential_mapping or {},
-            options=options,
-            retrieve=None,  # No special retrieval for SCF
-            restart_folder=None,
-            clean_workdir=False,  # Keep for DOS restart
-        )
-
-        # Add SCF task
-        scf_task_name = f'scf_{key}'
-        scf_task = wg.add_task(
-            VaspTask,
-            name=scf_task_name,
-            structure=struct,
-            code=code,
-            **scf_builder_inputs
-        )
+            dos_incar_final = base_dos_incar_final
+
+        # Add SCF task, reusing the one of an earlier key with the same
+        # structure node, SCF INCAR and k-points so each distinct SCF runs
+        # only once
+        scf_signature = _dos_batch_scf_signature(struct, scf_incar_final, kpoints_spacing)
+        scf_task = scf_tasks.get(scf_signature)
+        if scf_task is None:
+            scf_builder_inputs = _prepare_builder_inputs(
+                incar=scf_incar_final,
+                kpoints_spacing=kpoints_spacing,
+                potential_family=potential_family,
+                potential_mapping=potential_mapping,
+                options=options,
+                retrieve=None,  # No special retrieval for SCF
+                restart_folder=None,
+                clean_workdir=False,  # Keep for DOS restart
+                dict_nodes=dict_nodes,
+            )
+            scf_task = wg.add_task(
+                VaspTask,
+                name=f'scf_{key}',
+                structure=struct,
+                code=code,
+                **scf_builder_inputs
+            )
+            if scf_signature is not None:
+                scf_tasks[scf_signature] = scf_task
+        scf_task_name = scf_task.name
 
         # Prepare DOS builder inputs
         # Note: We prepare the base inputs here, then add restart in add_task
@@ -410,11 +415,12 @@ def quick_dos_batch(
             incar=dos_incar_final,
             kpoints_spacing=dos_kpoints_spacing,
             potential_family=potential_family,
-            potential_mapping=potential_mapping or {},
+            potential_mapping=potential_mapping,
             options=options,
             retrieve=dos_retrieve,
             restart_folder=None,  # Will be passed directly below
             clean_workdir=clean_workdir,
+            dict_nodes=dict_nodes,
         )
 
         # Add DOS task with restart from SCF
@@ -452,8 +458,50 @@ def quick_dos_batch(
         _wait_for_completion(wg.pk, poll_interval)
 
     # Return the WorkGraph PK with keys for reference
-    return {
+    result = {
         '__workgraph_pk__': wg.pk,
         '__task_map__': task_map,
-        **{key: wg.pk for key in structures.keys()},
     }
+    # Fill the per-key PKs in place rather than unpacking a temporary dict
+    for key in structures:
+        result[key] = wg.pk
+    return result
+
+
+def _dos_batch_scf_incar(incar: dict) -> dict:
+    """Return a copy of an SCF INCAR set up for a DOS restart (static, WAVECAR/CHGCAR written)."""
+    scf_incar_final = dict(incar)
+    scf_incar_final['lwave'] = True
+    scf_incar_final['lcharg'] = True
+    scf_incar_final.setdefault('nsw', 0)
+    scf_incar_final.setdefault('ibrion', -1)
+    return scf_incar_final
+
+
+def _dos_batch_dos_incar(incar: dict) -> dict:
+    """
+    Return a copy of a DOS INCAR for a static non-SCF run.
+
+    ISTART/ICHARG are not set: the restart.folder mechanism in VaspWorkChain
+    handles WAVECAR/CHGCAR copying automatically.
+    """
+    dos_incar_final = dict(incar)
+    dos_incar_final.setdefault('nsw', 0)
+    dos_incar_final.setdefault('ibrion', -1)
+    return dos_incar_final
+
+
+def _dos_batch_scf_signature(
+    struct: orm.StructureData, incar: dict, kpoints_spacing: float
+) -> t.Optional[tuple]:
+    """
+    Return a key identifying an SCF run by its inputs, or None if it cannot be keyed.
+
+    The INCAR is keyed by its canonical JSON, so equal INCARs match whatever
+    their key order; INCARs with non-JSON values are never shared.
+    """
+    try:
+        incar_key = json.dumps(incar, sort_keys=True)
+    except TypeError:
+        return None
+    return (struct.uuid, incar_key, kpoints_spacing)
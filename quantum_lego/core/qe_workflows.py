@@ -7,10 +7,14 @@ sequential calculations using PwBaseWorkChain from aiida-quantumespresso.
 import typing as t
 
 from aiida import orm
-from aiida.plugins import WorkflowFactory
-from aiida_workgraph import WorkGraph, task
+from aiida_workgraph import WorkGraph
 
+from .bricks import BRICK_REGISTRY
 from .workflow_utils import (
+    _build_indexed_output_name,
+    _get_task_class,
+    _load_code,
+    _load_structure,
     _validate_stages,
     _wait_for_completion,
 )
@@ -84,12 +88,10 @@ def quick_qe(
     if options is None:
         raise ValueError("options is required - specify scheduler resources")
 
-    # Load structure if PK
-    if isinstance(structure, int):
-        structure = orm.load_node(structure)
+    structure = _load_structure(structure)
 
     # Load code
-    code = orm.load_code(code_label)
+    code = _load_code(code_label)
 
     # Load pseudo family and get pseudos
     pseudo_family_group = orm.load_group(pseudo_family)
@@ -97,9 +99,7 @@ def quick_qe(
         raise ValueError(f"Group '{pseudo_family}' is not a PseudoPotentialFamily")
     pseudos = pseudo_family_group.get_pseudos(structure=structure)
 
-    # Get PwBaseWorkChain and wrap as task
-    PwBaseWorkChain = WorkflowFactory('quantumespresso.pw.base')
-    QeTask = task(PwBaseWorkChain)
+    QeTask = _get_task_class('quantumespresso.pw.base')
 
     # Build WorkGraph
     wg = WorkGraph(name=name)
@@ -115,15 +115,23 @@ def quick_qe(
     # Handle restart
     restart_arg = {}
     if restart_from is not None:
-        restart_node = orm.load_node(restart_from)
-        # Navigate to remote_folder output
-        if hasattr(restart_node, 'outputs'):
-            # Try to get remote folder from the QE task output
-            from aiida.common.links import LinkType
-            for link in restart_node.base.links.get_outgoing(link_type=LinkType.RETURN).all():
-                if 'remote' in link.link_label.lower():
-                    restart_arg = {'pw__parent_folder': link.node}
-                    break
+        restart_node = orm.load_node(restart_from)  # raises if the PK does not exist
+        # Find the first returned remote folder; the label match is done in
+        # the database instead of loading every returned node
+        from aiida.common.links import LinkType
+        qb = orm.QueryBuilder()
+        qb.append(orm.Node, filters={'id': restart_node.pk}, tag='restart')
+        qb.append(
+            orm.RemoteData,
+            with_incoming='restart',
+            edge_tag='return_link',
+            edge_filters={'type': LinkType.RETURN.value, 'label': {'ilike': '%remote%'}},
+            project='*',
+        )
+        qb.order_by({'return_link': 'id'})
+        match = qb.first()
+        if match is not None:
+            restart_arg = {'pw__parent_folder': match[0]}
 
     # Build task inputs
     qe_kwargs = {
@@ -276,12 +284,10 @@ def quick_qe_sequential(
     # Validate stages
     _validate_stages(stages)
 
-    # Load structure if PK
-    if isinstance(structure, int):
-        structure = orm.load_node(structure)
+    structure = _load_structure(structure)
 
     # Load code
-    code = orm.load_code(code_label)
+    code = _load_code(code_label)
 
     # Build WorkGraph
     wg = WorkGraph(name=name)
@@ -294,6 +300,30 @@ def quick_qe_sequential(
     stage_names = []  # Ordered list
     stage_types = {}  # name -> 'qe'
     stage_namespaces = {}  # name -> namespace_map
+    stage_configs = {stage['name']: stage for stage in stages}  # name -> raw stage dict
+
+    brick = BRICK_REGISTRY['qe']
+
+    # Context shared by every brick call; bricks only read it, so build it
+    # once and advance stage_index per stage instead of rebuilding it.
+    context = {
+        'wg': wg,
+        'code': code,
+        'pseudo_family': pseudo_family,
+        'options': options,
+        'base_kpoints_spacing': kpoints_spacing,
+        'clean_workdir': clean_workdir,
+        'stage_tasks': stage_tasks,
+        'stage_types': stage_types,
+        'stage_names': stage_names,
+        'stages': stages,
+        'stage_configs': stage_configs,
+        'input_structure': structure,
+        'stage_index': 0,
+        'max_concurrent_jobs': max_concurrent_jobs,
+        'pseudos': {},
+        'codes': {},
+    }
 
     for i, stage in enumerate(stages):
         stage_name = stage['name']
@@ -301,31 +331,14 @@ def quick_qe_sequential(
         stage_names.append(stage_name)
         stage_types[stage_name] = stage_type
 
-        # Build context for brick modules
-        context = {
-            'wg': wg,
-            'code': code,
-            'pseudo_family': pseudo_family,
-            'options': options,
-            'base_kpoints_spacing': kpoints_spacing,
-            'clean_workdir': clean_workdir,
-            'stage_tasks': stage_tasks,
-            'stage_types': stage_types,
-            'stage_names': stage_names,
-            'stages': stages,
-            'input_structure': structure,
-            'stage_index': i,
-            'max_concurrent_jobs': max_concurrent_jobs,
-        }
+        context['stage_index'] = i
 
         # Delegate to QE brick module
-        from .bricks import get_brick_module
-        brick = get_brick_module('qe')
         tasks_result = brick.create_stage_tasks(wg, stage, stage_name, context)
         stage_tasks[stage_name] = tasks_result
 
         # Build namespace_map with index prefix for ordered display
-        indexed_name = f's{i + 1:02d}_{stage_name}'
+        indexed_name = _build_indexed_output_name(i + 1, stage_name)
         namespace_map = {'main': indexed_name}
 
         stage_namespaces[stage_name] = namespace_map
@@ -339,10 +352,13 @@ def quick_qe_sequential(
         _wait_for_completion(wg.pk, poll_interval)
 
     # Return result dict
-    return {
+    result = {
         '__workgraph_pk__': wg.pk,
         '__stage_names__': stage_names,
         '__stage_types__': stage_types,
         '__stage_namespaces__': stage_namespaces,
-        **{name: wg.pk for name in stage_names},
     }
+    # Fill the per-key PKs in place rather than unpacking a temporary dict
+    for key in stage_names:
+        result[key] = wg.pk
+    return result
@@ -35,35 +35,30 @@ def get_results(pk: int) -> dict:
         'pk': pk,
     }
 
-    # Try to get outputs directly
-    if hasattr(node, 'outputs'):
-        outputs = node.outputs
-
+    # Try to get outputs directly. Missing ports raise AttributeError, so
+    # each output is read once with a default instead of hasattr + getattr.
+    outputs = getattr(node, 'outputs', None)
+    if outputs is not None:
         # Energy (might be exposed as workgraph output or in misc)
-        if hasattr(outputs, 'energy'):
-            energy_node = outputs.energy
-            if hasattr(energy_node, 'value'):
-                result['energy'] = energy_node.value
-            else:
-                result['energy'] = float(energy_node)
+        energy_node = getattr(outputs, 'energy', None)
+        if energy_node is not None:
+            energy = getattr(energy_node, 'value', None)
+            result['energy'] = energy if energy is not None else float(energy_node)
 
         # Structure
-        if hasattr(outputs, 'structure'):
-            result['structure'] = outputs.structure
+        result['structure'] = getattr(outputs, 'structure', None)
 
         # Misc
-        if hasattr(outputs, 'misc'):
-            misc_node = outputs.misc
-            if hasattr(misc_node, 'get_dict'):
-                result['misc'] = misc_node.get_dict()
-            else:
-                result['misc'] = dict(misc_node)
+        misc_node = getattr(outputs, 'misc', None)
+        if misc_node is not None:
+            get_dict = getattr(misc_node, 'get_dict', None)
+            result['misc'] = get_dict() if get_dict is not None else dict(misc_node)
 
         # Retrieved files
-        if hasattr(outputs, 'retrieved'):
-            result['files'] = outputs.retrieved
-        elif hasattr(outputs, 'files'):
-            result['files'] = outputs.files
+        files = getattr(outputs, 'retrieved', None)
+        if files is None:
+            files = getattr(outputs, 'files', None)
+        result['files'] = files
 
     # For WorkGraph nodes, traverse to find VASP outputs
     if result['energy'] is None or result['misc'] is None:
@@ -285,43 +280,31 @@ def get_dos_results(pk: int) -> dict:
         'pk': pk,
     }
 
-    # Try to get outputs directly from BandsWorkChain
-    if hasattr(node, 'outputs'):
-        outputs = node.outputs
-
-        # DOS ArrayData (direct BandsWorkChain output)
-        if hasattr(outputs, 'dos'):
-            result['dos'] = outputs.dos
-
-        # Projectors (direct BandsWorkChain output)
-        if hasattr(outputs, 'projectors'):
-            result['projectors'] = outputs.projectors
+    # Try to get outputs directly from BandsWorkChain, reading each port
+    # once with a default
+    outputs = getattr(node, 'outputs', None)
+    if outputs is not None:
+        # DOS ArrayData and projectors (direct BandsWorkChain outputs)
+        result['dos'] = getattr(outputs, 'dos', None)
+        result['projectors'] = getattr(outputs, 'projectors', None)
 
         # SCF outputs (from modified BandsWorkChain)
-        if hasattr(outputs, 'scf_misc'):
-            misc_node = outputs.scf_misc
-            if hasattr(misc_node, 'get_dict'):
-                result['scf_misc'] = misc_node.get_dict()
-                if result['energy'] is None:
-                    result['energy'] = _extract_energy_from_misc(result['scf_misc'])
-
-        if hasattr(outputs, 'scf_remote_folder'):
-            result['scf_remote'] = outputs.scf_remote_folder
+        misc_node = getattr(outputs, 'scf_misc', None)
+        if hasattr(misc_node, 'get_dict'):
+            result['scf_misc'] = misc_node.get_dict()
+            if result['energy'] is None:
+                result['energy'] = _extract_energy_from_misc(result['scf_misc'])
 
-        if hasattr(outputs, 'scf_retrieved'):
-            result['scf_retrieved'] = outputs.scf_retrieved
+        result['scf_remote'] = getattr(outputs, 'scf_remote_folder', None)
+        result['scf_retrieved'] = getattr(outputs, 'scf_retrieved', None)
 
         # DOS outputs (from modified BandsWorkChain)
-        if hasattr(outputs, 'dos_misc'):
-            misc_node = outputs.dos_misc
-            if hasattr(misc_node, 'get_dict'):
-                result['dos_misc'] = misc_node.get_dict()
+        misc_node = getattr(outputs, 'dos_misc', None)
+        if hasattr(misc_node, 'get_dict'):
+            result['dos_misc'] = misc_node.get_dict()
 
-        if hasattr(outputs, 'dos_remote_folder'):
-            result['dos_remote'] = outputs.dos_remote_folder
-
-        if hasattr(outputs, 'dos_retrieved'):
-            result['files'] = outputs.dos_retrieved
+        result['dos_remote'] = getattr(outputs, 'dos_remote_folder', None)
+        result['files'] = getattr(outputs, 'dos_retrieved', None)
 
     # Get input structure
     if hasattr(node, 'inputs') and hasattr(node.inputs, 'structure'):
@@ -506,9 +489,16 @@ def get_batch_dos_results(batch_result: dict) -> t.Dict[str, dict]:
     task_map = batch_result['__task_map__']
 
     wg_node = orm.load_node(wg_pk)
+    # The outputs namespace is the same for every key: resolve it once
+    outputs = getattr(wg_node, 'outputs', None)
+
+    # Split the task map into parallel columns once
+    keys = tuple(task_map)
+    scf_task_names = tuple(task_info.get('scf_task') for task_info in task_map.values())
+    dos_task_names = tuple(task_info['dos_task'] for task_info in task_map.values())
 
     results = {}
-    for key, task_info in task_map.items():
+    for key, scf_task_name, dos_task_name in zip(keys, scf_task_names, dos_task_names):
         # Initialize result dict for this structure
         result = {
             'energy': None,
@@ -522,41 +512,24 @@ def get_batch_dos_results(batch_result: dict) -> t.Dict[str, dict]:
             'key': key,
         }
 
-        scf_task_name = task_info.get('scf_task')
-        dos_task_name = task_info['dos_task']
-
         # Try to access via WorkGraph outputs (exposed outputs)
-        if hasattr(wg_node, 'outputs'):
-            outputs = wg_node.outputs
-
+        if outputs is not None:
             # SCF outputs
-            scf_misc_attr = f'{key}_scf_misc'
-            if hasattr(outputs, scf_misc_attr):
-                misc_node = getattr(outputs, scf_misc_attr)
-                if hasattr(misc_node, 'get_dict'):
-                    result['scf_misc'] = misc_node.get_dict()
-                    # Extract energy from SCF misc
-                    if result['energy'] is None:
-                        result['energy'] = _extract_energy_from_misc(result['scf_misc'])
-
-            scf_remote_attr = f'{key}_scf_remote'
-            if hasattr(outputs, scf_remote_attr):
-                result['scf_remote'] = getattr(outputs, scf_remote_attr)
+            misc_node = getattr(outputs, f'{key}_scf_misc', None)
+            if misc_node is not None and hasattr(misc_node, 'get_dict'):
+                result['scf_misc'] = misc_node.get_dict()
+                # Extract energy from SCF misc
+                result['energy'] = _extract_energy_from_misc(result['scf_misc'])
 
-            # DOS outputs
-            dos_misc_attr = f'{key}_dos_misc'
-            if hasattr(outputs, dos_misc_attr):
-                misc_node = getattr(outputs, dos_misc_attr)
-                if hasattr(misc_node, 'get_dict'):
-                    result['dos_misc'] = misc_node.get_dict()
+            result['scf_remote'] = getattr(outputs, f'{key}_scf_remote', None)
 
-            dos_remote_attr = f'{key}_dos_remote'
-            if hasattr(outputs, dos_remote_attr):
-                result['dos_remote'] = getattr(outputs, dos_remote_attr)
+            # DOS outputs
+            misc_node = getattr(outputs, f'{key}_dos_misc', None)
+            if misc_node is not None and hasattr(misc_node, 'get_dict'):
+                result['dos_misc'] = misc_node.get_dict()
 
-            dos_retrieved_attr = f'{key}_dos_retrieved'
-            if hasattr(outputs, dos_retrieved_attr):
-                result['files'] = getattr(outputs, dos_retrieved_attr)
+            result['dos_remote'] = getattr(outputs, f'{key}_dos_remote', None)
+            result['files'] = getattr(outputs, f'{key}_dos_retrieved', None)
 
         # Fallback: Traverse links to find VaspWorkChain outputs (for stored nodes)
         if result['energy'] is None or result['dos_misc'] is None:
@@ -740,11 +713,22 @@ def get_sequential_results(sequential_result: dict) -> t.Dict[str, dict]:
         >>> for stage, data in results.items():
         ...     print(f"{stage}: E = {data['energy']:.4f} eV")
     """
+    from .bricks import get_brick_module
+
+    wg_pk = sequential_result['__workgraph_pk__']
     stage_names = sequential_result['__stage_names__']
+    stage_types = sequential_result.get('__stage_types__', {})
+    stage_namespaces = sequential_result.get('__stage_namespaces__', {})
+
+    # Load the WorkGraph once for all stages instead of per stage
+    wg_node = orm.load_node(wg_pk)
 
     results = {}
     for stage_name in stage_names:
-        results[stage_name] = get_stage_results(sequential_result, stage_name)
+        brick = get_brick_module(stage_types.get(stage_name, 'vasp'))
+        results[stage_name] = brick.get_stage_results(
+            wg_node, wg_pk, stage_name, stage_namespaces.get(stage_name)
+        )
 
     return results
 
@@ -836,11 +820,11 @@ def print_sequential_results(sequential_result: dict) -> None:
 
     results = get_sequential_results(sequential_result)
 
+    from .bricks import get_brick_module
     for i, (stage_name, stage_result) in enumerate(results.items(), 1):
         stage_type = stage_types.get(stage_name, 'vasp')
 
         # Delegate to brick module
-        from .bricks import get_brick_module
         brick = get_brick_module(stage_type)
         brick.print_stage_results(i, stage_name, stage_result)
 
@@ -1,5 +1,6 @@
 """Default file retrieval settings for lego VASP workflows."""
 
+import functools
 import typing as t
 from typing import Final
 
@@ -38,4 +39,20 @@ def build_vasp_retrieve(
     extra: t.Optional[t.Iterable[str]] = None,
 ) -> t.List[str]:
     """Return the effective retrieve list for VASP workflows."""
-    return merge_retrieve_lists(DEFAULT_VASP_RETRIEVE, retrieve, extra)
+    if not retrieve and not extra:
+        # Common case: nothing to add, and the defaults are already unique
+        return list(DEFAULT_VASP_RETRIEVE)
+    # Every stage and batch calculation asks for one of a few lists, so the
+    # merge is cached; the caller still gets its own list to modify.
+    return list(_merged_vasp_retrieve(
+        tuple(retrieve) if retrieve else (),
+        tuple(extra) if extra else (),
+    ))
+
+
+@functools.lru_cache(maxsize=64)
+def _merged_vasp_retrieve(
+    retrieve: t.Tuple[str, ...],
+    extra: t.Tuple[str, ...],
+) -> t.Tuple[str, ...]:
+    return tuple(merge_retrieve_lists(DEFAULT_VASP_RETRIEVE, retrieve, extra))
@@ -9,6 +9,10 @@ import typing as t
 
 from aiida import orm
 
+from .common.u_calculation.utils import (
+    DEFAULT_POTENTIAL_VALUES,
+    prepare_ground_state_incar,
+)
 from .vasp_workflows import quick_vasp_sequential
 
 
@@ -81,11 +85,6 @@ def quick_hubbard_u(
     Reference:
         https://www.vasp.at/wiki/index.php/Calculate_U_for_LSDA+U
     """
-    from quantum_lego.core.common.u_calculation.utils import (
-        DEFAULT_POTENTIAL_VALUES,
-        prepare_ground_state_incar,
-    )
-
     # Validate required inputs
     if structure is None:
         raise ValueError("structure is required")
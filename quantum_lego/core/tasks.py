@@ -223,13 +223,11 @@ def compute_dynamics(
 
     # Create positions_dof array: True = relax, False = fix
     num_atoms = len(structure.sites)
-    positions_dof = []
-
-    for i in range(1, num_atoms + 1):  # 1-based indexing
-        if i in fixed_atoms_list:
-            positions_dof.append([False, False, False])  # Fix atom
-        else:
-            positions_dof.append([True, True, True])  # Relax atom
+    fixed = frozenset(fixed_atoms_list)
+    positions_dof = [
+        [i not in fixed] * 3  # 1-based indexing; False = fix atom
+        for i in range(1, num_atoms + 1)
+    ]
 
     return orm.Dict(dict={'positions_dof': positions_dof})
 
@@ -538,77 +536,72 @@ def concatenate_trajectories(
         except (KeyError, AttributeError):
             symbols = []
 
-    positions_parts = []
-    cells_parts = []
-    step_parts = []
-    times_parts = []
-    velocities_parts = []
-
-    have_cells = True
-    have_times = True
-    have_velocities = True
-
+    def stored_dtype(traj, name):
+        # Read the dtype from the .npy header without loading the array
+        from numpy.lib import format as npy_format
+        try:
+            with traj.base.repository.open(f'{name}.npy', mode='rb') as handle:
+                version = npy_format.read_magic(handle)
+                if version == (1, 0):
+                    return npy_format.read_array_header_1_0(handle)[2]
+                if version == (2, 0):
+                    return npy_format.read_array_header_2_0(handle)[2]
+        except (OSError, ValueError):
+            pass
+        return traj.get_array(name).dtype
+
+    # Size each output from the shapes stored on the nodes, then copy the
+    # stages in one at a time: only the result and a single stage's array
+    # are in memory, instead of every stage plus the concatenated copy.
+    def concatenate(name, dtype=None):
+        shapes = [traj.get_shape(name) for traj in ordered]
+        frame_shape = shapes[0][1:]
+        if any(len(shape) == 0 or shape[1:] != frame_shape for shape in shapes):
+            raise ValueError(f"'{name}' arrays have incompatible shapes: {shapes}")
+        total = sum(shape[0] for shape in shapes)
+        # Promote across all stages so a wider later stage is not narrowed
+        if dtype is None:
+            dtype = np.result_type(*(stored_dtype(traj, name) for traj in ordered))
+        out = np.empty((total, *frame_shape), dtype=dtype)
+        offset = 0
+        for traj, shape in zip(ordered, shapes):
+            part = traj.get_array(name)
+            out[offset:offset + shape[0]] = part
+            offset += shape[0]
+        return out
+
+    # Renumber step ids so they continue across stages
+    stepids = concatenate('steps', dtype=int)
     next_step = 0
-    core_arrays = {'positions', 'cells', 'steps', 'times', 'velocities'}
-    common_extra_arrays = None
-
+    offset = 0
     for traj in ordered:
-        positions = np.asarray(traj.get_positions())
-        positions_parts.append(positions)
-
-        steps = np.asarray(traj.get_stepids(), dtype=int)
-        if steps.size > 0:
-            steps = steps - steps[0] + next_step
+        n_frames = traj.get_shape('steps')[0]
+        if n_frames:
+            steps = stepids[offset:offset + n_frames]
+            steps += next_step - steps[0]
             next_step = int(steps[-1]) + 1
-        step_parts.append(steps)
-
-        if have_cells:
-            try:
-                cells = traj.get_cells()
-                if cells is None:
-                    raise KeyError('cells not available')
-                cells_parts.append(np.asarray(cells))
-            except (KeyError, AttributeError):
-                have_cells = False
-                cells_parts = []
-
-        if have_times:
-            try:
-                times = traj.get_times()
-                if times is None:
-                    raise KeyError('times not available')
-                times_parts.append(np.asarray(times, dtype=float))
-            except (KeyError, AttributeError):
-                have_times = False
-                times_parts = []
-
-        if have_velocities:
-            try:
-                velocities = traj.get_velocities()
-                if velocities is None:
-                    raise KeyError('velocities not available')
-                velocities_parts.append(np.asarray(velocities, dtype=float))
-            except (KeyError, AttributeError):
-                have_velocities = False
-                velocities_parts = []
-
-        names = set(traj.get_arraynames()) - core_arrays
-        common_extra_arrays = names if common_extra_arrays is None else (common_extra_arrays & names)
+        offset += n_frames
+
+    # Optional arrays are kept only when every stage has them
+    array_names = [set(traj.get_arraynames()) for traj in ordered]
+    common_arrays = set.intersection(*array_names)
 
     result = orm.TrajectoryData()
     result.set_trajectory(
         symbols=symbols,
-        positions=np.concatenate(positions_parts, axis=0),
-        stepids=np.concatenate(step_parts, axis=0),
-        cells=(np.concatenate(cells_parts, axis=0) if have_cells and cells_parts else None),
-        times=(np.concatenate(times_parts, axis=0) if have_times and times_parts else None),
-        velocities=(np.concatenate(velocities_parts, axis=0) if have_velocities and velocities_parts else None),
+        positions=concatenate('positions'),
+        stepids=stepids,
+        cells=concatenate('cells') if 'cells' in common_arrays else None,
+        times=concatenate('times', dtype=float) if 'times' in common_arrays else None,
+        velocities=(
+            concatenate('velocities', dtype=float) if 'velocities' in common_arrays else None
+        ),
     )
 
-    for name in sorted(common_extra_arrays or set()):
+    core_arrays = {'positions', 'cells', 'steps', 'times', 'velocities'}
+    for name in sorted(common_arrays - core_arrays):
         try:
-            arrays = [traj.get_array(name) for traj in ordered]
-            result.set_array(name, np.concatenate(arrays, axis=0))
+            result.set_array(name, concatenate(name))
         except (KeyError, ValueError, AttributeError):
             continue
 
@@ -76,8 +76,14 @@ class StageContext(TypedDict, total=False):
         stage_tasks: Dict mapping stage names to their task outputs
         stage_types: Dict mapping stage names to their brick types
         stage_names: List of stage names in order
+        stage_configs: Dict mapping stage names to their raw stage config dicts
         stage_index: Current stage index
         input_structure: Input structure for the workflow
+        dict_nodes: Cache passed to _prepare_builder_inputs so equal
+            orm.Dict inputs are shared by all stages of the graph
+        pseudos: Cache of resolved pseudopotentials per (family, kinds), so
+            QE stages on the same composition query the family once
+        codes: Cache of codes loaded for per-stage code_label overrides
     """
     code: Any  # AiiDA Code node
     potential_family: str
@@ -88,8 +94,12 @@ class StageContext(TypedDict, total=False):
     stage_tasks: Dict[str, 'StageTasksResult']
     stage_types: Dict[str, str]
     stage_names: List[str]
+    stage_configs: Dict[str, Dict[str, Any]]
     stage_index: int
     input_structure: Any  # AiiDA StructureData node
+    dict_nodes: Dict[str, Any]  # JSON key -> orm.Dict
+    pseudos: Dict[Any, Dict[str, Any]]  # (family, kind names) -> pseudos
+    codes: Dict[str, Any]  # code label -> AiiDA Code node
 
 
 class StageTasksResult(TypedDict, total=False):
@@ -5,7 +5,8 @@ and sequential calculations. It handles VASP WorkChain setup, restart
 chaining, supercell transformations, and multi-stage pipelines.
 
 quick_vasp and quick_vasp_batch are thin wrappers around quick_vasp_sequential,
-which is the central entry point. For more specialized workflows, see
+which is the central entry point; make_vasp_sequential_builder prepares a
+reusable submitter for parameter sweeps over a fixed stage list. For more specialized workflows, see
 specialized_workflows.py (quick_hubbard_u, quick_aimd).
 """
 
@@ -15,7 +16,12 @@ from aiida import orm
 
 from aiida_workgraph import WorkGraph
 
+from .tasks import concatenate_trajectories
 from .workflow_utils import (
+    _EMPTY_MAPPING,
+    _load_code,
+    _load_structure,
+    _load_structures,
     _wait_for_completion,
     _validate_stages,
     _build_indexed_output_name,
@@ -23,6 +29,20 @@ from .workflow_utils import (
 )
 
 
+# Output namespaces each stage type exposes; all share the stage's indexed name.
+_DEFAULT_NAMESPACE_KEYS = ('main',)
+_STAGE_NAMESPACE_KEYS = {
+    'dos': ('main', 'scf', 'dos'),
+    'hybrid_bands': ('main', 'scf'),
+}
+
+# Stage fields holding INCAR dicts (plain and composite bricks), patched by
+# make_vasp_sequential_builder's incar_overrides.
+_STAGE_INCAR_FIELDS = (
+    'incar', 'scf_incar', 'dos_incar', 'base_incar', 'bulk_incar', 'slab_incar',
+)
+
+
 def quick_vasp(
     structure: t.Union[orm.StructureData, int] = None,
     code_label: str = None,
@@ -222,14 +242,21 @@ def quick_vasp_batch(
         raise ValueError("options is required - specify scheduler resources")
 
     if incar_overrides is None:
-        incar_overrides = {}
+        incar_overrides = _EMPTY_MAPPING
+
+    # Load every structure given as a PK in one query and hand the nodes to
+    # the batch brick, so it does not load them again one by one.
+    structure_nodes = _load_structures(structures)
+
+    # Use first structure as input (will be overridden per-calc by batch brick)
+    first_struct = next(iter(structure_nodes.values()))
 
     # Build calculations dict for batch stage
     calculations = {}
-    for key, struct_input in structures.items():
+    for key, struct_node in structure_nodes.items():
         calc_config = {}
         # Per-calc structure
-        calc_config['structure'] = struct_input
+        calc_config['structure'] = struct_node
         # INCAR overrides
         if key in incar_overrides:
             calc_config['incar'] = incar_overrides[key]
@@ -247,12 +274,6 @@ def quick_vasp_batch(
     if kpoints_spacing != 0.03:
         stage['kpoints_spacing'] = kpoints_spacing
 
-    # Use first structure as input (will be overridden per-calc by batch brick)
-    first_key = next(iter(structures))
-    first_struct = structures[first_key]
-    if isinstance(first_struct, int):
-        first_struct = orm.load_node(first_struct)
-
     result = quick_vasp_sequential(
         structure=first_struct,
         stages=[stage],
@@ -485,14 +506,196 @@ def quick_vasp_sequential(
         raise ValueError("options is required - specify scheduler resources")
 
     # Validate stages
-    _validate_stages(stages)
+    stage_bricks = _validate_stages(stages)
+
+    return _submit_vasp_sequential(
+        structure=structure,
+        stages=stages,
+        stage_bricks=stage_bricks,
+        code=_load_code(code_label),
+        kpoints_spacing=kpoints_spacing,
+        potential_family=potential_family,
+        potential_mapping=potential_mapping,
+        options=options,
+        max_concurrent_jobs=max_concurrent_jobs,
+        name=name,
+        wait=wait,
+        poll_interval=poll_interval,
+        clean_workdir=clean_workdir,
+        concatenate_aimd_trajectories=concatenate_aimd_trajectories,
+        serialize_stages=serialize_stages,
+    )
+
+
+def make_vasp_sequential_builder(
+    stages: t.List[dict] = None,
+    code_label: str = None,
+    kpoints_spacing: float = 0.03,
+    potential_family: str = 'PBE',
+    potential_mapping: dict = None,
+    options: dict = None,
+    max_concurrent_jobs: int = None,
+    clean_workdir: bool = False,
+    concatenate_aimd_trajectories: bool = False,
+    serialize_stages: bool = False,
+) -> t.Callable[..., dict]:
+    """
+    Prepare a reusable quick_vasp_sequential submitter for a fixed stage list.
+
+    Parameter sweeps (e.g. the same relax -> scf -> dos pipeline for many
+    cutoffs) call quick_vasp_sequential with stage lists that only differ in
+    a few INCAR values. This validates the stage skeleton and loads the code
+    once, and returns a ``build`` callable that only patches INCAR values and
+    submits.
 
-    # Load structure if PK
-    if isinstance(structure, int):
-        structure = orm.load_node(structure)
+    The returned callable has the signature::
 
-    # Load code
-    code = orm.load_code(code_label)
+        build(structure, incar_overrides=None, name='quick_vasp_sequential',
+              wait=False, poll_interval=10.0) -> dict
+
+    ``incar_overrides`` maps INCAR keys to new values. Each key replaces the
+    value in every INCAR dict of every stage that already sets it (matched
+    case-insensitively), including the ``scf_incar``/``dos_incar`` and
+    ``base_incar`` style dicts of composite bricks; keys not set anywhere
+    raise ValueError. Patched stages are validated again before submission,
+    since bricks and stage connections depend on INCAR values (IBRION, NSW,
+    LHFCALC, ...). The result dict has the same shape as
+    quick_vasp_sequential.
+
+    Args:
+        stages: List of stage configuration dicts (see quick_vasp_sequential)
+        code_label: VASP code label
+        kpoints_spacing: Default k-points spacing in A^-1 * 2pi
+        potential_family: POTCAR family name
+        potential_mapping: Element to POTCAR mapping
+        options: Scheduler options dict
+        max_concurrent_jobs: Maximum concurrent VASP calculations
+        clean_workdir: Whether to clean remote working directories
+        concatenate_aimd_trajectories: Whether to concatenate AIMD trajectories
+        serialize_stages: Whether to force stages to run one after another
+
+    Returns:
+        Callable that submits one WorkGraph per call.
+
+    Example:
+        >>> build = make_vasp_sequential_builder(
+        ...     stages=stages, code_label='VASP-6.5.1@localwork', options=options,
+        ... )
+        >>> results = {encut: build(structure, incar_overrides={'ENCUT': encut})
+        ...            for encut in (400, 450, 500, 550)}
+    """
+    if stages is None:
+        raise ValueError("stages is required - provide list of stage configurations")
+    if code_label is None:
+        raise ValueError("code_label is required")
+    if options is None:
+        raise ValueError("options is required - specify scheduler resources")
+
+    # Snapshot the stage configs so later edits by the caller cannot bypass
+    # the validation done here. Each build() call submits its own copy, as
+    # bricks may rebind INCAR entries of the stage dicts they are given.
+    stages = [_copy_stage_config(stage) for stage in stages]
+    stage_bricks = _validate_stages(stages)
+    code = _load_code(code_label)
+
+    # (stage index, INCAR field) -> {lowercase INCAR key: key as spelled there}
+    incar_keys = {
+        (i, field): {key.lower(): key for key in stage[field]}
+        for i, stage in enumerate(stages)
+        for field in _STAGE_INCAR_FIELDS
+        if isinstance(stage.get(field), dict) and stage[field]
+    }
+    known_keys = {key for keys in incar_keys.values() for key in keys}
+
+    def build(
+        structure: t.Union[orm.StructureData, int] = None,
+        incar_overrides: dict = None,
+        name: str = 'quick_vasp_sequential',
+        wait: bool = False,
+        poll_interval: float = 10.0,
+    ) -> dict:
+        if structure is None:
+            raise ValueError("structure is required")
+
+        stage_list = [_copy_stage_config(stage) for stage in stages]
+        build_bricks = stage_bricks
+        if incar_overrides:
+            overrides = {key.lower(): value for key, value in incar_overrides.items()}
+            unknown = sorted(set(overrides) - known_keys)
+            if unknown:
+                raise ValueError(
+                    f"incar_overrides keys {unknown} are not set by any stage; "
+                    f"only existing INCAR values can be swept"
+                )
+            for (i, field), keys in incar_keys.items():
+                for key, value in overrides.items():
+                    if key in keys:
+                        stage_list[i][field][keys[key]] = value
+            # Brick checks and stage connections depend on INCAR values
+            build_bricks = _validate_stages(stage_list)
+
+        return _submit_vasp_sequential(
+            structure=structure,
+            stages=stage_list,
+            stage_bricks=build_bricks,
+            code=code,
+            kpoints_spacing=kpoints_spacing,
+            potential_family=potential_family,
+            potential_mapping=potential_mapping,
+            options=options,
+            max_concurrent_jobs=max_concurrent_jobs,
+            name=name,
+            wait=wait,
+            poll_interval=poll_interval,
+            clean_workdir=clean_workdir,
+            concatenate_aimd_trajectories=concatenate_aimd_trajectories,
+            serialize_stages=serialize_stages,
+        )
+
+    return build
+
+
+def _copy_stage_config(value):
+    """Copy the nested dicts/lists of a stage config, sharing leaf objects.
+
+    Unlike copy.deepcopy this keeps AiiDA nodes referenced by the stage
+    (structures, restart folders, ...) as the same objects.
+    """
+    if isinstance(value, dict):
+        return {key: _copy_stage_config(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_stage_config(item) for item in value]
+    return value
+
+
+def _submit_vasp_sequential(
+    structure: t.Union[orm.StructureData, int],
+    stages: t.List[dict],
+    stage_bricks: t.List[t.Tuple[str, t.Any]],
+    code: orm.Code,
+    kpoints_spacing: float,
+    potential_family: str,
+    potential_mapping: t.Optional[dict],
+    options: dict,
+    max_concurrent_jobs: t.Optional[int],
+    name: str,
+    wait: bool,
+    poll_interval: float,
+    clean_workdir: bool,
+    concatenate_aimd_trajectories: bool,
+    serialize_stages: bool,
+) -> dict:
+    """
+    Build and submit the sequential WorkGraph for already-validated stages.
+
+    stage_bricks is the (stage_type, brick) list returned by _validate_stages.
+    """
+    structure = _load_structure(structure)
+
+    # Bricks receive potential_mapping as a plain dict (some pass it straight
+    # to graph tasks), so normalise it once rather than once per stage.
+    if potential_mapping is None:
+        potential_mapping = {}
 
     # Build WorkGraph
     wg = WorkGraph(name=name)
@@ -505,37 +708,50 @@ def quick_vasp_sequential(
     stage_names = []  # Ordered list
     stage_types = {}  # name -> 'vasp', 'dos', 'batch', 'bader', etc.
     stage_namespaces = {}  # name -> namespace_map (e.g. {'main': 's01_relax_2x2_rough'})
+    stage_configs = {stage['name']: stage for stage in stages}  # name -> raw stage dict
+    aimd_stages = [  # AIMD stage names, in order (for trajectory concatenation)
+        stage['name'] for stage, (stage_type, _) in zip(stages, stage_bricks)
+        if stage_type == 'aimd'
+    ]
     _prev_stage_leaf_task = None  # Used by serialize_stages
     _WG_BUILTIN_TASK_NAMES = {'graph_inputs', 'graph_outputs', 'graph_ctx'}
 
-    for i, stage in enumerate(stages):
+    # Context shared by every brick call; bricks only read it, so build it
+    # once and advance stage_index per stage instead of rebuilding it.
+    context = {
+        'wg': wg,
+        'code': code,
+        'potential_family': potential_family,
+        'potential_mapping': potential_mapping,
+        'options': options,
+        'base_kpoints_spacing': kpoints_spacing,
+        'clean_workdir': clean_workdir,
+        'stage_tasks': stage_tasks,
+        'stage_types': stage_types,
+        'stage_names': stage_names,
+        'stages': stages,
+        'stage_configs': stage_configs,
+        'input_structure': structure,
+        # Equal options/mapping/INCAR dicts share one orm.Dict across stages
+        'dict_nodes': {},
+        # Codes of stages overriding code_label, loaded once per graph
+        'codes': {},
+        'stage_index': 0,
+        'max_concurrent_jobs': max_concurrent_jobs,
+    }
+
+    # Bricks were resolved once by _validate_stages
+    for i, (stage, (stage_type, brick)) in enumerate(zip(stages, stage_bricks)):
         stage_name = stage['name']
-        stage_type = stage.get('type', 'vasp')
         stage_names.append(stage_name)
         stage_types[stage_name] = stage_type
 
-        # Build context for brick modules
-        context = {
-            'wg': wg,
-            'code': code,
-            'potential_family': potential_family,
-            'potential_mapping': potential_mapping or {},
-            'options': options,
-            'base_kpoints_spacing': kpoints_spacing,
-            'clean_workdir': clean_workdir,
-            'stage_tasks': stage_tasks,
-            'stage_types': stage_types,
-            'stage_names': stage_names,
-            'stages': stages,
-            'input_structure': structure,
-            'stage_index': i,
-            'max_concurrent_jobs': max_concurrent_jobs,
-        }
+        context['stage_index'] = i
 
-        # Delegate to brick module
-        from .bricks import get_brick_module
-        brick = get_brick_module(stage_type)
-        _names_before = {t.name for t in wg.tasks if t.name not in _WG_BUILTIN_TASK_NAMES}
+        # Snapshotting wg.tasks walks every task added so far, so only pay for
+        # it when serialize_stages needs to know which tasks this stage added.
+        if serialize_stages:
+            _names_before = {t.name for t in wg.tasks if t.name not in _WG_BUILTIN_TASK_NAMES}
         tasks_result = brick.create_stage_tasks(wg, stage, stage_name, context)
         stage_tasks[stage_name] = tasks_result
 
@@ -543,54 +759,46 @@ def quick_vasp_sequential(
         # Task.waiting_on.add() is used here — it adds _wait links AND stores names in _items.
         # We clear _items before submit (see below) so the DB never has a non-empty wait list,
         # preventing WorkGraph.from_dict from re-validating task names before all tasks exist.
-        _new_tasks_all = [t for t in wg.tasks
-                           if t.name not in _WG_BUILTIN_TASK_NAMES and t.name not in _names_before]
-        if serialize_stages and _prev_stage_leaf_task is not None and _new_tasks_all:
-            _new_tasks_all[0].waiting_on.add(_prev_stage_leaf_task)
-        if _new_tasks_all:
-            _prev_stage_leaf_task = _new_tasks_all[-1]
+        if serialize_stages:
+            _new_tasks_all = [t for t in wg.tasks
+                              if t.name not in _WG_BUILTIN_TASK_NAMES and t.name not in _names_before]
+            if _prev_stage_leaf_task is not None and _new_tasks_all:
+                _new_tasks_all[0].waiting_on.add(_prev_stage_leaf_task)
+            if _new_tasks_all:
+                _prev_stage_leaf_task = _new_tasks_all[-1]
 
         # Build namespace_map with index prefix for ordered display
         # Use 's' prefix (stage) since Python identifiers can't start with digits
         indexed_name = _build_indexed_output_name(i + 1, stage_name)
-        namespace_map = {'main': indexed_name}
-        if stage_type == 'dos':
-            namespace_map['scf'] = indexed_name
-            namespace_map['dos'] = indexed_name
-        elif stage_type == 'hybrid_bands':
-            namespace_map['scf'] = indexed_name
+        namespace_map = dict.fromkeys(
+            _STAGE_NAMESPACE_KEYS.get(stage_type, _DEFAULT_NAMESPACE_KEYS), indexed_name,
+        )
 
         stage_namespaces[stage_name] = namespace_map
         brick.expose_stage_outputs(wg, stage_name, tasks_result, namespace_map)
 
-    # Concatenate AIMD trajectories if requested
-    if concatenate_aimd_trajectories:
-        from .tasks import concatenate_trajectories
-
+    # Concatenate AIMD trajectories if requested (only when AIMD stages exist)
+    if concatenate_aimd_trajectories and aimd_stages:
         # Collect trajectory outputs from AIMD stages
         # IMPORTANT: Use task output sockets directly - do NOT access wg.outputs
         # during workgraph construction (those are setter-only attributes)
-        traj_inputs = {}
-        for stage_name in stage_names:
-            if stage_types[stage_name] == 'aimd':
-                ns = stage_namespaces[stage_name]['main']
-                # Prefer normalized trajectory socket when provided by AIMD brick.
-                trajectory_task = stage_tasks[stage_name].get('trajectory')
-                if trajectory_task is not None:
-                    traj_inputs[ns] = trajectory_task.outputs.result
-                else:
-                    vasp_task = stage_tasks[stage_name]['vasp']
-                    traj_inputs[ns] = vasp_task.outputs.trajectory
-
-        # Only add concatenate task if we have AIMD stages
-        if traj_inputs:
-            concat_task = wg.add_task(
-                concatenate_trajectories,
-                name='concatenate_trajectories',
-                trajectories=traj_inputs,
+        # Prefer normalized trajectory socket when provided by AIMD brick.
+        traj_inputs = {
+            stage_namespaces[name]['main']: (
+                stage_tasks[name]['trajectory'].outputs.result
+                if stage_tasks[name].get('trajectory') is not None
+                else stage_tasks[name]['vasp'].outputs.trajectory
             )
-            combined_name = _build_combined_trajectory_output_name(len(stage_names))
-            setattr(wg.outputs, combined_name, concat_task.outputs.result)
+            for name in aimd_stages
+        }
+
+        concat_task = wg.add_task(
+            concatenate_trajectories,
+            name='concatenate_trajectories',
+            trajectories=traj_inputs,
+        )
+        combined_name = _build_combined_trajectory_output_name(len(stage_names))
+        setattr(wg.outputs, combined_name, concat_task.outputs.result)
 
     # Clear waiting_on._items before submitting.
     # waiting_on.add() already created _wait links; clearing _items makes the serialized
@@ -608,10 +816,13 @@ def quick_vasp_sequential(
         _wait_for_completion(wg.pk, poll_interval)
 
     # Return result dict
-    return {
+    result = {
         '__workgraph_pk__': wg.pk,
         '__stage_names__': stage_names,
         '__stage_types__': stage_types,
         '__stage_namespaces__': stage_namespaces,
-        **{name: wg.pk for name in stage_names},
     }
+    # Fill the per-key PKs in place rather than unpacking a temporary dict
+    for key in stage_names:
+        result[key] = wg.pk
+    return result
@@ -7,21 +7,137 @@ workflow completion, validating stage configurations, and building
 output names.
 """
 
+import functools
+import json
+import threading
 import typing as t
-import time
+import warnings
+from collections import Counter, OrderedDict
+from types import MappingProxyType
 
+import numpy as np
 from aiida import orm
+from aiida.common.exceptions import NotExistent
+from aiida.engine.processes.builder import ProcessBuilderNamespace
+from aiida.manage.configuration import get_profile
 
+from .common.fixed_atoms import get_fixed_atoms_list
+from .results import _extract_energy_from_misc
 from .utils import get_status
 from .retrieve_defaults import build_vasp_retrieve
 
+# Shared read-only stand-in for omitted mapping arguments (incar_overrides,
+# ...). Only use it where the value is only read: never where it could be
+# mutated, passed to a task as-is, or turned into an orm.Dict (_dict_node
+# cannot key a mappingproxy, so such nodes would not be shared).
+_EMPTY_MAPPING: t.Mapping[str, t.Any] = MappingProxyType({})
+
+
+def _load_code(code_label: str, codes: t.Optional[dict] = None) -> orm.AbstractCode:
+    """
+    Load a code by label, reusing the node already loaded for this graph.
+
+    Builders pass one codes cache per graph build (like dict_nodes), so
+    stages overriding ``code_label`` with the same label query the database
+    once. Nothing is kept across builds, so relabelled or deleted codes are
+    never served stale.
+
+    Args:
+        code_label: Code label, e.g. 'VASP-6.5.1@localwork'
+        codes: Cache shared by the caller, or None to always query
+
+    Returns:
+        The loaded code node.
+    """
+    if codes is None:
+        return orm.load_code(code_label)
+    code = codes.get(code_label)
+    if code is None:
+        code = codes[code_label] = orm.load_code(code_label)
+    return code
+
+
+@functools.lru_cache(maxsize=None)
+def _get_task_class(entry_point: str):
+    """
+    Return the WorkGraph task wrapping the WorkChain registered as entry_point.
+
+    Every brick used to call ``task(WorkflowFactory(...))`` per stage; the
+    wrapper only depends on the WorkChain class, so build it once per process
+    and share it between stages and submissions.
+
+    Args:
+        entry_point: Workflow entry point, e.g. 'vasp.v2.vasp'
+
+    Returns:
+        The task handle to pass to ``WorkGraph.add_task``.
+    """
+    from aiida.plugins import WorkflowFactory
+    from aiida_workgraph import task
+
+    return task(WorkflowFactory(entry_point))
+
+
+def _load_structure(structure: t.Union[orm.StructureData, int]) -> orm.StructureData:
+    """
+    Return a StructureData for a structure argument given as node or PK.
+
+    Args:
+        structure: Int PK (loaded) or structure input (returned as-is)
+
+    Returns:
+        The StructureData node.
+    """
+    # Nodes are the common case, so check for them first
+    if isinstance(structure, orm.StructureData):
+        return structure
+    if isinstance(structure, int):
+        return orm.load_node(structure)
+    return structure
+
+
+def _load_structures(
+    structures: t.Mapping[str, t.Union[orm.StructureData, int]],
+) -> t.Dict[str, orm.StructureData]:
+    """
+    Resolve a mapping of structure arguments, loading all PKs in one query.
+
+    Like ``_load_structure`` for each value, but batches given as PKs cost a
+    single database round trip instead of one per structure. Values that are
+    not int PKs are passed through unchanged.
+
+    Args:
+        structures: Dict mapping keys to StructureData nodes or their PKs
+
+    Returns:
+        Dict mapping the same keys to StructureData nodes, in the same order.
+
+    Raises:
+        NotExistent: If a PK does not correspond to a node.
+    """
+    pks = {structure for structure in structures.values() if isinstance(structure, int)}
+    if not pks:
+        return dict(structures)
+
+    qb = orm.QueryBuilder().append(orm.Node, filters={'id': {'in': list(pks)}})
+    nodes = {node.pk: node for node in qb.all(flat=True)}
+    missing = pks.difference(nodes)
+    if missing:
+        raise NotExistent(f"No node found with PK(s) {sorted(missing)}")
+
+    return {
+        key: nodes[structure] if isinstance(structure, int) else structure
+        for key, structure in structures.items()
+    }
+
 
 def _builder_to_dict(builder) -> dict:
     """
-    Recursively convert a ProcessBuilder to a plain dict.
+    Convert a ProcessBuilder to a plain dict.
 
     ProcessBuilderNamespace objects need to be converted to regular dicts
-    for use with WorkGraph add_task().
+    for use with WorkGraph add_task(). Nested namespaces are walked with an
+    explicit stack rather than recursion.
 
     Args:
         builder: ProcessBuilder or ProcessBuilderNamespace
@@ -29,20 +145,84 @@ def _builder_to_dict(builder) -> dict:
     Returns:
         Plain dict with all nested namespaces converted
     """
-    from aiida.engine.processes.builder import ProcessBuilderNamespace
-
     result = {}
-    for key, value in builder.items():
-        if isinstance(value, ProcessBuilderNamespace):
-            # Recursively convert nested namespaces
-            nested = _builder_to_dict(value)
-            if nested:  # Only include non-empty namespaces
-                result[key] = nested
-        elif value is not None:
-            result[key] = value
+    # (namespace, dict it converts into, parent dict, key in parent)
+    stack = [(builder, result, None, None)]
+    visited = []
+    while stack:
+        namespace, target, parent, key = stack.pop()
+        visited.append((target, parent, key))
+        for name, value in namespace.items():
+            if isinstance(value, ProcessBuilderNamespace):
+                # Insert the child now so key order matches the builder
+                target[name] = child = {}
+                stack.append((value, child, target, name))
+            elif value is not None:
+                target[name] = value
+
+    # Only include non-empty namespaces. Children are visited after their
+    # parents, so walking backwards prunes empty leaves before their parents.
+    for target, parent, key in reversed(visited):
+        if parent is not None and not target:
+            del parent[key]
     return result
 
 
+def _dict_node(content: t.Mapping[str, t.Any], dict_nodes: t.Optional[dict] = None) -> orm.Dict:
+    """
+    Return an orm.Dict for content, reusing an equal node from dict_nodes.
+
+    Builders that create many tasks with the same INCAR, options or
+    potential mapping pass one dict_nodes cache for the whole graph, so
+    equal inputs become a single node instead of one node per task.
+
+    Args:
+        content: Dict contents
+        dict_nodes: Cache shared by the caller, or None to always create
+            a new node
+
+    Returns:
+        An (unstored) orm.Dict, shared between equal contents when cached.
+    """
+    if dict_nodes is None:
+        return orm.Dict(dict=content)
+    try:
+        key = json.dumps(content, sort_keys=True)
+    except TypeError:  # non-JSON values or mixed key types: do not share
+        return orm.Dict(dict=content)
+    node = dict_nodes.get(key)
+    if node is None:
+        node = dict_nodes[key] = orm.Dict(dict=content)
+    return node
+
+
+def _kpoints_mesh_node(
+    mesh: t.Sequence[int], dict_nodes: t.Optional[dict] = None
+) -> orm.KpointsData:
+    """
+    Return a KpointsData for an explicit mesh, reusing an equal node from dict_nodes.
+
+    Shares the per-graph cache used by _dict_node, so tasks with the same
+    explicit mesh get one KpointsData node instead of one node per task.
+
+    Args:
+        mesh: K-points mesh [nx, ny, nz]
+        dict_nodes: Cache shared by the caller, or None to always create
+            a new node
+
+    Returns:
+        An (unstored) orm.KpointsData, shared between equal meshes when cached.
+    """
+    key = ('kpoints_mesh', tuple(mesh))
+    node = dict_nodes.get(key) if dict_nodes is not None else None
+    if node is None:
+        node = orm.KpointsData()
+        node.set_kpoints_mesh(mesh)
+        if dict_nodes is not None:
+            dict_nodes[key] = node
+    return node
+
+
 def _prepare_builder_inputs(
     incar: dict,
     kpoints_spacing: float,
@@ -57,6 +237,7 @@ def _prepare_builder_inputs(
     fix_type: str = None,
     fix_thickness: float = 0.0,
     fix_elements: t.List[str] = None,
+    dict_nodes: t.Optional[dict] = None,
 ) -> dict:
     """
     Prepare builder inputs for VaspWorkChain.
@@ -75,50 +256,48 @@ def _prepare_builder_inputs(
         fix_type: Where to fix atoms ('bottom', 'center', 'top', or None)
         fix_thickness: Thickness in Angstroms for fixing region
         fix_elements: Optional list of element symbols to fix
+        dict_nodes: Optional cache shared across calls (see _dict_node) so
+            equal parameters/options/mapping/settings reuse one node
 
     Returns:
         Dict of prepared inputs for VaspWorkChain
     """
-    from .common.fixed_atoms import get_fixed_atoms_list
-
     prepared = {}
 
     # Parameters (INCAR)
-    prepared['parameters'] = orm.Dict(dict={'incar': incar})
+    prepared['parameters'] = _dict_node({'incar': incar}, dict_nodes)
 
     # K-points: explicit mesh or spacing
     if kpoints_mesh is not None:
-        kpoints = orm.KpointsData()
-        kpoints.set_kpoints_mesh(kpoints_mesh)
-        prepared['kpoints'] = kpoints
+        prepared['kpoints'] = _kpoints_mesh_node(kpoints_mesh, dict_nodes)
     else:
         prepared['kpoints_spacing'] = float(kpoints_spacing)
 
     # Potentials
     prepared['potential_family'] = potential_family
-    prepared['potential_mapping'] = orm.Dict(dict=potential_mapping)
+    prepared['potential_mapping'] = _dict_node(potential_mapping, dict_nodes)
 
     # Options
-    prepared['options'] = orm.Dict(dict=options)
+    prepared['options'] = _dict_node(options, dict_nodes)
 
     # Clean workdir
     prepared['clean_workdir'] = clean_workdir
 
     # Settings (for file retrieval)
     # Note: aiida-vasp expects UPPERCASE keys for settings
-    settings = {}
     retrieve_list = build_vasp_retrieve(retrieve)
     if retrieve_list:
-        settings['ADDITIONAL_RETRIEVE_LIST'] = retrieve_list
-    if settings:
-        prepared['settings'] = orm.Dict(dict=settings)
+        prepared['settings'] = _dict_node(
+            {'ADDITIONAL_RETRIEVE_LIST': retrieve_list}, dict_nodes
+        )
 
     # Restart folder
     if restart_folder is not None:
         prepared['restart'] = {'folder': restart_folder}
 
-    # Selective dynamics (fix atoms)
-    if structure is not None and fix_type is not None and fix_thickness > 0.0:
+    # Selective dynamics (fix atoms); most calls have no fix_type, so test
+    # that first
+    if fix_type is not None and structure is not None and fix_thickness > 0.0:
         fixed_atoms_list = get_fixed_atoms_list(
             structure=structure,
             fix_type=fix_type,
@@ -129,40 +308,130 @@ def _prepare_builder_inputs(
         if fixed_atoms_list:
             # Create positions_dof array: True = relax, False = fix
             num_atoms = len(structure.sites)
-            positions_dof = []
-
-            for i in range(1, num_atoms + 1):  # 1-based indexing
-                if i in fixed_atoms_list:
-                    positions_dof.append([False, False, False])  # Fix atom
-                else:
-                    positions_dof.append([True, True, True])  # Relax atom
+            positions_dof = np.ones((num_atoms, 3), dtype=bool)
+            positions_dof[np.asarray(fixed_atoms_list, dtype=np.int64) - 1] = False  # 1-based indices
 
-            prepared['dynamics'] = orm.Dict(dict={'positions_dof': positions_dof})
+            prepared['dynamics'] = orm.Dict(dict={'positions_dof': positions_dof.tolist()})
 
     return prepared
 
 
-def _wait_for_completion(pk: int, poll_interval: float) -> None:
+# Terminal process states, as reported by get_status()
+_TERMINAL_STATUSES = frozenset({'finished', 'failed', 'excepted', 'killed'})
+
+# While subscribed to state broadcasts, the database is only re-checked every
+# poll_interval * _BROADCAST_RECHECK_FACTOR seconds as a safety net against
+# missed messages (e.g. a broker reconnect).
+_BROADCAST_RECHECK_FACTOR = 10
+
+# Without a broker, the polling interval grows by this factor after every
+# unchanged status check, up to max_interval.
+_POLL_BACKOFF_FACTOR = 1.5
+
+
+def _get_communicator():
+    """Return the profile's broker communicator, or None if unavailable."""
+    from aiida.manage import get_manager
+
+    manager = get_manager()
+    profile = manager.get_profile()
+    if profile is None or profile.process_control_backend is None:
+        return None
+    try:
+        return manager.get_communicator()
+    except Exception:  # broker configured but unreachable: fall back to polling
+        return None
+
+
+def _subscribe_to_termination(pk: int, callback: t.Callable[[], None]) -> t.Optional[t.Callable[[], None]]:
+    """
+    Call ``callback`` when process ``pk`` broadcasts a terminal state change.
+
+    Args:
+        pk: Process PK
+        callback: Called without arguments from the communicator thread
+
+    Returns:
+        A function that removes the subscription, or None if no broker
+        is available.
+    """
+    import kiwipy
+
+    communicator = _get_communicator()
+    if communicator is None:
+        return None
+
+    broadcast_filter = kiwipy.BroadcastFilter(lambda *args, **kwargs: callback(), sender=pk)
+    for state in ('finished', 'excepted', 'killed'):
+        broadcast_filter.add_subject_filter(f'state_changed.*.{state}')
+    try:
+        identifier = communicator.add_broadcast_subscriber(broadcast_filter)
+    except Exception:
+        return None
+    return lambda: communicator.remove_broadcast_subscriber(identifier)
+
+
+def _wait_for_completion(
+    pk: int,
+    poll_interval: float,
+    max_interval: float = 30.0,
+) -> None:
     """
     Block until a WorkGraph completes.
 
+    When the profile has a message broker, this subscribes to the process's
+    state-change broadcasts and wakes as soon as it terminates, only
+    re-checking the database occasionally. Without a broker it polls the
+    process state, starting every ``poll_interval`` seconds and backing off
+    towards ``max_interval`` while the status stays the same.
+
     Args:
         pk: WorkGraph PK
-        poll_interval: Seconds between status checks
+        poll_interval: Seconds between the first status checks
+        max_interval: Upper bound for the backed-off polling interval
     """
     print(f"Waiting for WorkGraph PK {pk} to complete...")
 
-    while True:
-        status = get_status(pk)
-
-        if status in ('finished', 'failed', 'excepted', 'killed'):
-            print(f"WorkGraph PK {pk} completed with status: {status}")
-            break
-
-        time.sleep(poll_interval)
-
-
-def _validate_stages(stages: t.List[dict]) -> None:
+    terminated = threading.Event()
+    unsubscribe = _subscribe_to_termination(pk, terminated.set)
+    backoff = unsubscribe is None
+    max_interval = max(max_interval, poll_interval)
+    recheck_interval = poll_interval
+    if not backoff:
+        recheck_interval = poll_interval * _BROADCAST_RECHECK_FACTOR
+    last_status = None
+
+    try:
+        # Check after subscribing so a WorkGraph that finished in between is
+        # not missed.
+        while True:
+            status = get_status(pk)
+
+            if status in _TERMINAL_STATUSES:
+                print(f"WorkGraph PK {pk} completed with status: {status}")
+                break
+
+            if backoff:
+                if status != last_status:
+                    # Progress: go back to fast polling.
+                    recheck_interval = poll_interval
+                elif recheck_interval > 0:
+                    recheck_interval = min(
+                        recheck_interval * _POLL_BACKOFF_FACTOR, max_interval
+                    )
+                last_status = status
+
+            if terminated.wait(recheck_interval):
+                # Broadcast received but the stored state lags behind:
+                # poll normally until it catches up.
+                terminated.clear()
+                recheck_interval = poll_interval
+    finally:
+        if unsubscribe is not None:
+            unsubscribe()
+
+
+def _validate_stages(stages: t.List[dict]) -> t.List[t.Tuple[str, t.Any]]:
     """
     Validate sequential stage configuration.
 
@@ -171,45 +440,65 @@ def _validate_stages(stages: t.List[dict]) -> None:
     Args:
         stages: List of stage configuration dicts
 
+    Returns:
+        List of (stage_type, brick module) pairs, one per stage in order,
+        so builders do not need to resolve the types again.
+
     Raises:
         ValueError: If validation fails
     """
-    import warnings as _warnings
-    from .bricks import get_brick_module, VALID_BRICK_TYPES, validate_connections
+    # Imported here: the brick modules import this module at load time
+    from .bricks import BRICK_REGISTRY, VALID_BRICK_TYPES, validate_connections
 
     if not stages:
         raise ValueError("stages list cannot be empty")
 
-    stage_names = set()
+    # Check names for all stages up front
     for i, stage in enumerate(stages):
-        # Require name
         if 'name' not in stage:
             raise ValueError(f"Stage {i} missing required 'name' field")
+    name_counts = Counter(stage['name'] for stage in stages)
+    if len(name_counts) != len(stages):
+        duplicate = next(name for name, count in name_counts.items() if count > 1)
+        raise ValueError(f"Duplicate stage name: '{duplicate}'")
 
+    # Bricks see the names of the stages up to and including their own
+    stage_names = set()
+    stage_bricks = []
+    for stage in stages:
         name = stage['name']
-        if name in stage_names:
-            raise ValueError(f"Duplicate stage name: '{name}'")
         stage_names.add(name)
 
         # Get stage type (default to 'vasp')
         stage_type = stage.get('type', 'vasp')
-        if stage_type not in VALID_BRICK_TYPES:
+
+        # One registry lookup both checks the type and finds its brick
+        brick = BRICK_REGISTRY.get(stage_type)
+        if brick is None:
             raise ValueError(
                 f"Stage '{name}' type='{stage_type}' must be one of {VALID_BRICK_TYPES}"
             )
 
         # Delegate type-specific validation to brick module
-        brick = get_brick_module(stage_type)
         brick.validate_stage(stage, stage_names)
+        stage_bricks.append((stage_type, brick))
 
     # Validate inter-stage connections using port declarations
     connection_warnings = validate_connections(stages)
     for w in connection_warnings:
-        _warnings.warn(w, stacklevel=3)
+        warnings.warn(w, stacklevel=3)
+
+    return stage_bricks
+
+
+# Prefixes for the stage indices pipelines actually use
+_INDEXED_OUTPUT_PREFIXES = tuple(f's{index:02d}_' for index in range(100))
 
 
 def _build_indexed_output_name(index: int, name: str) -> str:
     """Build a stable indexed output name (e.g. ``s01_relax``)."""
+    if 0 <= index < len(_INDEXED_OUTPUT_PREFIXES):
+        return _INDEXED_OUTPUT_PREFIXES[index] + name
     return f's{index:02d}_{name}'
 
 
@@ -218,6 +507,91 @@ def _build_combined_trajectory_output_name(stage_count: int) -> str:
     return _build_indexed_output_name(stage_count + 1, 'combined_trajectory')
 
 
+def _query_task_outputs(
+    wg_pk: int,
+    task_names: t.Iterable[str],
+    ports: t.Iterable[str],
+) -> t.Dict[str, t.Dict[str, orm.Data]]:
+    """
+    Fetch selected output nodes of several WorkGraph tasks in one query.
+
+    Processes launched by a WorkGraph are linked to it with CALL links
+    labelled by task name, so the outputs of all requested tasks can be
+    collected without loading each process node.
+
+    Args:
+        wg_pk: WorkGraph PK
+        task_names: Names of the tasks to fetch outputs for
+        ports: Output link labels to fetch (e.g. 'misc', 'structure')
+
+    Returns:
+        Dict mapping task name -> {port: output node}, only containing
+        tasks that have produced at least one of the requested outputs.
+    """
+    qb = orm.QueryBuilder()
+    qb.append(orm.WorkflowNode, filters={'id': wg_pk}, tag='wg')
+    qb.append(
+        orm.ProcessNode,
+        with_incoming='wg',
+        edge_filters={'label': {'in': list(task_names)}},
+        edge_project='label',
+        tag='task',
+    )
+    qb.append(
+        orm.Data,
+        with_incoming='task',
+        edge_filters={'label': {'in': list(ports)}},
+        edge_project='label',
+        project='*',
+        tag='output',
+    )
+
+    outputs = {}
+    for row in qb.iterdict():
+        task_outputs = outputs.setdefault(row['wg--task']['label'], {})
+        task_outputs[row['task--output']['label']] = row['output']['*']
+    return outputs
+
+
+# Task outputs of sealed WorkGraphs, keyed by (profile, pk, task names, ports).
+# A sealed process cannot gain outputs, so these never go stale.
+_SEALED_TASK_OUTPUTS: 'OrderedDict[tuple, t.Dict[str, t.Dict[str, orm.Data]]]' = OrderedDict()
+_SEALED_TASK_OUTPUTS_MAXSIZE = 32
+
+
+def _query_sealed_task_outputs(
+    wg_pk: int,
+    task_names: t.Iterable[str],
+    ports: t.Iterable[str],
+) -> t.Dict[str, t.Dict[str, orm.Data]]:
+    """
+    Like ``_query_task_outputs``, but remember the result once the WorkGraph
+    is sealed, so notebooks re-reading a finished batch skip the query.
+
+    Callers must not mutate the returned mapping.
+    """
+    profile = get_profile()
+    cache_key = (
+        profile.name if profile else None,
+        wg_pk,
+        frozenset(task_names),
+        tuple(ports),
+    )
+    cached = _SEALED_TASK_OUTPUTS.get(cache_key)
+    if cached is not None:
+        _SEALED_TASK_OUTPUTS.move_to_end(cache_key)
+        return cached
+
+    # Check the seal before querying: outputs read from a sealed node are final
+    sealed = orm.load_node(wg_pk).is_sealed
+    outputs = _query_task_outputs(wg_pk, cache_key[2], cache_key[3])
+    if sealed:
+        _SEALED_TASK_OUTPUTS[cache_key] = outputs
+        if len(_SEALED_TASK_OUTPUTS) > _SEALED_TASK_OUTPUTS_MAXSIZE:
+            _SEALED_TASK_OUTPUTS.popitem(last=False)
+    return outputs
+
+
 def get_batch_results_from_workgraph(batch_result: dict) -> t.Dict[str, dict]:
     """
     Extract results from a quick_vasp_batch result.
@@ -228,57 +602,44 @@ def get_batch_results_from_workgraph(batch_result: dict) -> t.Dict[str, dict]:
     Returns:
         Dict mapping structure keys to result dicts
     """
-    from .results import get_results
-
     wg_pk = batch_result['__workgraph_pk__']
     task_map = batch_result['__task_map__']
 
-    wg_node = orm.load_node(wg_pk)
+    # Split the task map into parallel columns once
+    keys = tuple(task_map)
+    vasp_task_names = tuple(task_info['vasp_task'] for task_info in task_map.values())
+    energy_task_names = tuple(task_info['energy_task'] for task_info in task_map.values())
+
+    # Fetch every task output needed below in a single query
+    task_outputs = _query_sealed_task_outputs(
+        wg_pk,
+        {*vasp_task_names, *energy_task_names},
+        ('misc', 'structure', 'retrieved', 'result'),
+    )
 
     results = {}
-    for key, task_info in task_map.items():
-        # Extract results for this key
-        result = {
-            'energy': None,
-            'structure': None,
-            'misc': None,
-            'files': None,
+    for key, vasp_task_name, energy_task_name in zip(keys, vasp_task_names, energy_task_names):
+        vasp_outputs = task_outputs.get(vasp_task_name, _EMPTY_MAPPING)
+        misc_node = vasp_outputs.get('misc')
+        misc = misc_node.get_dict() if misc_node is not None else None
+
+        energy_node = task_outputs.get(energy_task_name, _EMPTY_MAPPING).get('result')
+        if energy_node is not None:
+            energy = energy_node.value
+        elif misc is not None:
+            # Extract energy from misc if not found
+            energy = _extract_energy_from_misc(misc)
+        else:
+            energy = None
+
+        # Build each result dict once, with its final values
+        results[key] = {
+            'energy': energy,
+            'structure': vasp_outputs.get('structure'),
+            'misc': misc,
+            'files': vasp_outputs.get('retrieved'),
             'pk': wg_pk,
             'key': key,
         }
 
-        # Access task outputs
-        vasp_task_name = task_info['vasp_task']
-        energy_task_name = task_info['energy_task']
-
-        if hasattr(wg_node, 'tasks'):
-            # Live WorkGraph
-            tasks = wg_node.tasks
-            if vasp_task_name in tasks:
-                vasp_task = tasks[vasp_task_name]
-                if hasattr(vasp_task.outputs, 'misc'):
-                    misc_val = vasp_task.outputs.misc.value
-                    if hasattr(misc_val, 'get_dict'):
-                        result['misc'] = misc_val.get_dict()
-                if hasattr(vasp_task.outputs, 'structure'):
-                    struct_val = vasp_task.outputs.structure.value
-                    if struct_val is not None:
-                        result['structure'] = struct_val
-                if hasattr(vasp_task.outputs, 'retrieved'):
-                    result['files'] = vasp_task.outputs.retrieved.value
-
-            if energy_task_name in tasks:
-                energy_task = tasks[energy_task_name]
-                if hasattr(energy_task.outputs, 'result'):
-                    energy_val = energy_task.outputs.result.value
-                    if energy_val is not None:
-                        result['energy'] = energy_val.value if hasattr(energy_val, 'value') else float(energy_val)
-
-        # Extract energy from misc if not found
-        if result['energy'] is None and result['misc'] is not None:
-            from .results import _extract_energy_from_misc
-            result['energy'] = _extract_energy_from_misc(result['misc'])
-
-        results[key] = result
-
     return results
@@ -2,37 +2,91 @@
 
 This module re-exports all workflow builder functions from their
 respective domain modules to maintain backward compatibility.
-All imports from this module continue to work as before.
+All imports from this module continue to work as before; the
+domain modules are imported on first access to one of their names.
 
 This facade is permanent - existing code using
 ``from quantum_lego.core.workgraph import quick_vasp`` will always work.
 
 The actual implementations live in:
-- vasp_workflows.py: quick_vasp, quick_vasp_batch, quick_vasp_sequential
+- vasp_workflows.py: quick_vasp, quick_vasp_batch, quick_vasp_sequential,
+  make_vasp_sequential_builder
 - dos_workflows.py: quick_dos, quick_dos_batch, quick_dos_sequential
 - qe_workflows.py: quick_qe, quick_qe_sequential
 - specialized_workflows.py: quick_hubbard_u, quick_aimd
 - workflow_utils.py: shared utilities and get_batch_results_from_workgraph
 """
 
-from .vasp_workflows import quick_vasp, quick_vasp_batch, quick_vasp_sequential
-from .dos_workflows import quick_dos, quick_dos_batch, quick_dos_sequential
-from .qe_workflows import quick_qe, quick_qe_sequential
-from .specialized_workflows import quick_hubbard_u, quick_aimd
-from .workflow_utils import (
-    get_batch_results_from_workgraph,
-    _builder_to_dict,
-    _prepare_builder_inputs,
-    _wait_for_completion,
-    _validate_stages,
-    _build_indexed_output_name,
-    _build_combined_trajectory_output_name,
-)
+import importlib
+import typing as t
+
+if t.TYPE_CHECKING:  # names for static analysis; resolved lazily at runtime
+    from .dos_workflows import quick_dos, quick_dos_batch, quick_dos_sequential
+    from .qe_workflows import quick_qe, quick_qe_sequential
+    from .specialized_workflows import quick_aimd, quick_hubbard_u
+    from .vasp_workflows import (
+        make_vasp_sequential_builder,
+        quick_vasp,
+        quick_vasp_batch,
+        quick_vasp_sequential,
+    )
+    from .workflow_utils import (
+        _build_combined_trajectory_output_name,
+        _build_indexed_output_name,
+        _builder_to_dict,
+        _load_code,
+        _load_structure,
+        _prepare_builder_inputs,
+        _validate_stages,
+        _wait_for_completion,
+        get_batch_results_from_workgraph,
+    )
+
+# Each public name and the module that implements it. The workflow modules
+# pull in aiida-workgraph, aiida-vasp and every brick, so they are only
+# imported when one of their names is first used (PEP 562).
+_LAZY_ATTRS = {
+    'quick_vasp': 'vasp_workflows',
+    'quick_vasp_batch': 'vasp_workflows',
+    'quick_vasp_sequential': 'vasp_workflows',
+    'make_vasp_sequential_builder': 'vasp_workflows',
+    'quick_dos': 'dos_workflows',
+    'quick_dos_batch': 'dos_workflows',
+    'quick_dos_sequential': 'dos_workflows',
+    'quick_qe': 'qe_workflows',
+    'quick_qe_sequential': 'qe_workflows',
+    'quick_hubbard_u': 'specialized_workflows',
+    'quick_aimd': 'specialized_workflows',
+    'get_batch_results_from_workgraph': 'workflow_utils',
+    '_load_code': 'workflow_utils',
+    '_load_structure': 'workflow_utils',
+    '_builder_to_dict': 'workflow_utils',
+    '_prepare_builder_inputs': 'workflow_utils',
+    '_wait_for_completion': 'workflow_utils',
+    '_validate_stages': 'workflow_utils',
+    '_build_indexed_output_name': 'workflow_utils',
+    '_build_combined_trajectory_output_name': 'workflow_utils',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __package__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_ATTRS})
+
 
 __all__ = [
     'quick_vasp',
     'quick_vasp_batch',
     'quick_vasp_sequential',
+    'make_vasp_sequential_builder',
     'quick_dos',
     'quick_dos_batch',
     'quick_dos_sequential',
@@ -41,6 +95,8 @@ __all__ = [
     'quick_hubbard_u',
     'quick_aimd',
     'get_batch_results_from_workgraph',
+    '_load_code',
+    '_load_structure',
     '_builder_to_dict',
     '_prepare_builder_inputs',
     '_wait_for_completion',
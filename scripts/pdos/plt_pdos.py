@@ -8,19 +8,22 @@ os links de saída do WorkGraph.
 Saída: results/pdos/<surface>_<config>_pdos.{png,pdf,csv}
 """
 
+import multiprocessing
+import os
 import re
-import shutil
 import tempfile
+import xml.etree.ElementTree as ET
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use('Agg')   # só grava arquivos: sem detecção de backend gráfico
+import matplotlib.pyplot as plt  # noqa: E402
 import numpy as np
-import pandas as pd
 
 from aiida import load_profile, orm
 from aiida.common.links import LinkType
-from pymatgen.electronic_structure.core import Spin
-from pymatgen.io.vasp.outputs import Vasprun
 
 # ---------------------------------------------------------------------------
 # Configuração
@@ -29,6 +32,7 @@ PROFILE        = 'presto'
 WORKGRAPH_PK   = 46202        # PK do WorkGraph principal
 
 ENERGY_RANGE   = (-5.0, 3.0)  # janela de energia relativa ao E_F (eV)
+MAX_WORKERS = None  # processos para os gráficos (None = nº de CPUs)
 
 ELEMENT_COLORS = {
     'Ag': '#808080',
@@ -41,12 +45,15 @@ ELEMENT_COLORS = {
 # Extração automática dos PKs a partir do WorkGraph
 # ---------------------------------------------------------------------------
 
+_DOS_STEP_RE = re.compile(r's\d+_dos_(\d+)_(.+)')
+
+
 def _parse_dos_step(label: str):
     """Tenta extrair (surface, config) de um label como 's07_dos_011_h2o'.
 
     Retorna (surface, config) ou None se o label não corresponder.
     """
-    m = re.match(r's\d+_dos_(\d+)_(.+)', label)
+    m = _DOS_STEP_RE.match(label)
     if m:
         return m.group(1), m.group(2)
     return None
@@ -56,13 +63,28 @@ def build_calcs_from_workgraph(wg_pk: int) -> dict:
     """Percorre os links de saída do WorkGraph e monta o mapeamento
 
     {(surface, config): {'dos_retrieved_pk': ..., 'scf_retrieved_pk': ...,
-                          'scf_misc_pk': ...}}
+                          'scf_misc_pk': ..., 'scf_efermi': ...}}
+
+    Uma única consulta (QueryBuilder) traz o label de cada link RETURN, o PK
+    do nó e o atributo efermi (presente apenas nos Dict misc), em vez de
+    carregar os nós um a um.
     """
-    wg = orm.load_node(wg_pk)
-    calcs: dict = {}
+    qb = orm.QueryBuilder()
+    qb.append(orm.Node, filters={'id': wg_pk}, tag='wg')
+    qb.append(
+        orm.Node,
+        with_incoming='wg',
+        tag='out',
+        edge_tag='link',
+        edge_filters={'type': LinkType.RETURN.value},
+        edge_project='label',
+        project=['id', 'attributes.efermi'],
+    )
 
-    for link in wg.base.links.get_outgoing(link_type=LinkType.RETURN).all():
-        label = link.link_label          # e.g. 's07_dos_011_h2o__scf__misc'
+    calcs: dict = {}
+    for row in qb.iterdict():
+        label = row['link']['label']     # e.g. 's07_dos_011_h2o__scf__misc'
+        pk = row['out']['id']
         parts = label.split('__')
         if len(parts) < 3:
             continue
@@ -70,16 +92,15 @@ def build_calcs_from_workgraph(wg_pk: int) -> dict:
         parsed = _parse_dos_step(step)
         if parsed is None:
             continue
-        surface, config = parsed
-        key = (surface, config)
-        calcs.setdefault(key, {})
+        entry = calcs.setdefault(parsed, {})
 
         if sub == 'scf' and field == 'retrieved':
-            calcs[key]['scf_retrieved_pk'] = link.node.pk
+            entry['scf_retrieved_pk'] = pk
         elif sub == 'scf' and field == 'misc':
-            calcs[key]['scf_misc_pk'] = link.node.pk
+            entry['scf_misc_pk'] = pk
+            entry['scf_efermi'] = row['out']['attributes.efermi']
         elif sub == 'dos' and field == 'retrieved':
-            calcs[key]['dos_retrieved_pk'] = link.node.pk
+            entry['dos_retrieved_pk'] = pk
 
     # Filtra apenas os cálculos com todos os campos necessários
     complete = {
@@ -92,58 +113,182 @@ def build_calcs_from_workgraph(wg_pk: int) -> dict:
 # Helpers
 # ---------------------------------------------------------------------------
 
-def extract_file(folder_data: orm.FolderData, filename: str,
-                 dest_dir: Path) -> Path:
-    dest = dest_dir / filename
-    with folder_data.open(filename, 'rb') as src, open(dest, 'wb') as dst:
-        shutil.copyfileobj(src, dst)
-    return dest
+def read_vasprun_efermi(vasprun):
+    """Lê apenas o E_fermi do bloco <dos> do vasprun.xml (caminho ou stream).
 
-
-def get_efermi(scf_misc_pk: int, scf_folder: orm.FolderData,
-               tmpdir: Path) -> float:
-    """Obtém E_fermi: tenta o Dict misc do AiiDA, depois vasprun.xml (parse_dos=True)."""
-    misc = orm.load_node(scf_misc_pk)
-    d = misc.get_dict()
-    if 'efermi' in d and d['efermi'] is not None:
-        return float(d['efermi'])
+    O XML é percorrido em stream (iterparse) e só o <i name="efermi"> do
+    <dos> principal é lido, sem montar as densidades (o <dos> do kpoints_opt
+    é ignorado, como no pymatgen). Retorna None se ausente.
+    """
+    efermi = None
+    for _, elem in ET.iterparse(vasprun, events=('end',)):
+        if elem.tag == 'dos' and elem.get('comment') != 'kpoints_opt':
+            node = elem.find("i[@name='efermi']")
+            if node is not None:
+                efermi = float(node.text)
+        if elem.tag in ('calculation', 'dos'):
+            elem.clear()   # libera a memória dos blocos já lidos
+    return efermi
+
+
+def get_efermi(scf_misc_pk: int, scf_retrieved_pk: int,
+               efermi=None, vasprun_efermi=None) -> float:
+    """Obtém E_fermi: usa o valor já consultado do misc Dict, depois o Dict
+    misc do AiiDA, depois o bloco <dos> do vasprun.xml.
+
+    vasprun_efermi é o valor já lido do mesmo vasprun.xml (quando SCF e DOS
+    usam a mesma pasta retrieved), evitando percorrer o arquivo de novo.
+    A pasta retrieved do SCF só é carregada se o vasprun.xml for lido.
+    """
+    if efermi is None:
+        efermi = orm.load_node(scf_misc_pk).get_dict().get('efermi')
+    if efermi is not None:
+        return float(efermi)
+    if vasprun_efermi is not None:
+        return float(vasprun_efermi)
 
     print('    [aviso] efermi não encontrado no misc Dict – lendo vasprun.xml...')
-    vasprun_path = extract_file(scf_folder, 'vasprun.xml', tmpdir)
-    vr = Vasprun(str(vasprun_path), parse_dos=True, parse_eigen=False,
-                 parse_potcar_file=False)
-    if vr.efermi is None:
+    scf_folder = orm.load_node(scf_retrieved_pk)
+    with scf_folder.open('vasprun.xml', 'rb') as vasprun:
+        efermi = read_vasprun_efermi(vasprun)
+    if efermi is None:
         raise ValueError('Não foi possível obter efermi do misc Dict nem do vasprun.xml')
-    return float(vr.efermi)
+    return efermi
 
-# ---------------------------------------------------------------------------
-# Plot
-# ---------------------------------------------------------------------------
 
-def plot_pdos(surface: str, config: str, pks: dict, out_dir: Path) -> None:
-    label = f'{surface}_{config}'
-    print(f'\n=== {label} ===')
+def _vasp_rows(set_elem) -> np.ndarray:
+    """Linhas <r> de um <set> do vasprun.xml como matriz (n_linhas, n_colunas)."""
+    rows = set_elem.findall('r')
+    values = np.array(' '.join(r.text for r in rows).split(), dtype=float)
+    return values.reshape(len(rows), -1)
 
-    dos_folder = orm.load_node(pks['dos_retrieved_pk'])
-    scf_folder = orm.load_node(pks['scf_retrieved_pk'])
 
-    with tempfile.TemporaryDirectory() as tmpdir_str:
-        tmpdir = Path(tmpdir_str)
+def _spin_key(set_elem) -> str:
+    # Mesma convenção do pymatgen: 'spin 1' é up, qualquer outro é down
+    return 'up' if set_elem.get('comment') == 'spin 1' else 'dn'
 
-        efermi = get_efermi(pks['scf_misc_pk'], scf_folder, tmpdir)
-        print(f'  E_fermi (SCF) = {efermi:.4f} eV')
 
-        dos_vasprun_path = extract_file(dos_folder, 'vasprun.xml', tmpdir)
-        vr = Vasprun(str(dos_vasprun_path), parse_dos=True, parse_eigen=False,
-                     parse_potcar_file=False)
+def parse_vasprun_dos(vasprun) -> dict:
+    """DOS total e por elemento lidas direto do vasprun.xml (caminho ou stream).
 
-        cdos = vr.complete_dos
-        energies = cdos.energies - efermi
-        is_spin = len(cdos.densities) > 1
+    Substitui Vasprun(parse_dos=True).complete_dos: o XML é percorrido uma
+    vez em stream (iterparse), guardando só <atominfo> e o último <dos>
+    principal; os demais blocos de cada <calculation> (forças, estruturas,
+    autovalores) são descartados assim que lidos. As densidades por elemento
+    somam todos os orbitais de todos os íons do elemento, como
+    CompleteDos.get_element_dos(). Retorna o dicionário de load_dos_arrays.
+    """
+    species: list = []
+    dos_elem = None
+    for _, elem in ET.iterparse(vasprun, events=('end',)):
+        if elem.tag == 'atominfo':
+            atoms = elem.find("array[@name='atoms']/set")
+            species = [rc.find('c').text.strip() for rc in atoms.findall('rc')]
+            elem.clear()
+        elif elem.tag == 'dos' and elem.get('comment') != 'kpoints_opt':
+            dos_elem = elem
+        elif elem.tag == 'calculation':
+            elem.clear()   # o <dos> já referenciado continua disponível
+    if dos_elem is None:
+        raise ValueError('vasprun.xml não contém o bloco <dos>')
+
+    total = {_spin_key(ss): _vasp_rows(ss)
+             for ss in dos_elem.find('total/array/set').findall('set')}
+    energies = total['up'][:, 0]
+    zeros = np.zeros_like(energies)
+    efermi = dos_elem.find("i[@name='efermi']")
+    data = {
+        'energies': energies,
+        'efermi': float(efermi.text) if efermi is not None else np.nan,
+        'tdos_up': total['up'][:, 1],
+        'tdos_dn': total['dn'][:, 1] if 'dn' in total else zeros,
+        'is_spin': len(total) > 1,
+    }
 
-        element_dos = cdos.get_element_dos()
-        elements = sorted(element_dos.keys(), key=lambda e: e.symbol)
+    element_sums: dict = {}
+    partial = dos_elem.find('partial/array/set')
+    if partial is not None:
+        for symbol, ion_set in zip(species, partial.findall('set')):
+            # Como no pymatgen, 'spin 2'..'spin 4' (não colinear) caem todos
+            # em 'dn' e o último prevalece; só o que prevalece é lido.
+            ion = {_spin_key(ss): ss for ss in ion_set.findall('set')}
+            sums = element_sums.setdefault(symbol, {})
+            for key, ss in ion.items():
+                # Um acumulador por (elemento, spin), criado na primeira vez
+                # e somado in-place, sem criar um novo array a cada íon.
+                acc = sums.get(key)
+                if acc is None:
+                    acc = sums[key] = np.zeros_like(energies)
+                np.add(acc, _vasp_rows(ss)[:, 1:].sum(axis=1), out=acc)
+
+    data['elements'] = sorted(element_sums)
+    for symbol, sums in element_sums.items():
+        data[f'{symbol}_up'] = sums.get('up', zeros)
+        data[f'{symbol}_dn'] = sums.get('dn', zeros)
+    return data
+
+
+def load_dos_arrays(dos_folder: orm.FolderData, cache_dir: Path) -> dict:
+    """DOS total e por elemento do vasprun.xml do cálculo DOS.
+
+    Retorna {'energies', 'efermi', 'tdos_up', 'tdos_dn', 'is_spin',
+    'elements'} e, para cada símbolo em 'elements', '<símbolo>_up' /
+    '<símbolo>_dn'. As energias não são deslocadas por E_F; 'efermi' é o do
+    próprio vasprun.xml (NaN se ausente).
+
+    O FolderData armazenado é imutável, então o resultado é guardado em
+    cache_dir/<uuid>.npz e reutilizado nas execuções seguintes, evitando
+    reprocessar o XML. PDOS_DISABLE_CACHE=1 força a leitura do vasprun.xml.
+    """
+    use_cache = os.environ.get('PDOS_DISABLE_CACHE') != '1'
+    cache_path = cache_dir / f'{dos_folder.uuid}.npz'
+    if use_cache and cache_path.exists():
+        try:
+            with np.load(cache_path) as cached:
+                data = {key: cached[key] for key in cached.files}
+            data['is_spin'] = bool(data['is_spin'])
+            data['efermi'] = float(data.get('efermi', np.nan))
+            data['elements'] = [str(sym) for sym in data['elements']]
+            return data
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile) as exc:
+            # Cache corrompido: trata como ausente e regrava abaixo
+            print(f'    [aviso] cache {cache_path.name} inválido ({exc}) – relendo vasprun.xml')
+
+    # Lido direto do repositório em stream, sem cópia para disco
+    with dos_folder.open('vasprun.xml', 'rb') as vasprun:
+        data = parse_vasprun_dos(vasprun)
+
+    if use_cache:
+        # Grava num arquivo temporário do mesmo diretório e renomeia:
+        # os.replace é atômico, então uma execução interrompida ou dois
+        # workers gravando a mesma entrada nunca deixam um .npz truncado.
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fh:
+                np.savez_compressed(fh, **data)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    return data
 
+
+# ---------------------------------------------------------------------------
+# Plot
+# ---------------------------------------------------------------------------
+
+_FIGURE = None
+
+
+def _pdos_axes():
+    """Figura reutilizada por todos os gráficos do processo (uma por worker).
+
+    O estilo é aplicado e a figura criada só na primeira chamada; nas
+    seguintes os eixos são apenas limpos.
+    """
+    global _FIGURE
+    if _FIGURE is None:
         plt.rcParams.update({
             'font.family': 'serif',
             'font.size': 14,
@@ -153,76 +298,113 @@ def plot_pdos(surface: str, config: str, pks: dict, out_dir: Path) -> None:
             'xtick.minor.visible': True,
             'ytick.minor.visible': True,
         })
+        _FIGURE = plt.subplots(figsize=(9, 6))
+    fig, ax = _FIGURE
+    ax.clear()
+    return fig, ax
 
-        fig, ax = plt.subplots(figsize=(9, 6))
 
-        # TDOS (fundo semitransparente)
-        tdos_up = cdos.densities.get(Spin.up, np.zeros_like(energies))
-        tdos_dn = cdos.densities.get(Spin.down, np.zeros_like(energies))
-        ax.fill_between(energies,  tdos_up,  color='lightgray', alpha=0.5,
-                        label='TDOS')
+def plot_pdos(surface: str, config: str, pks: dict, out_dir: Path) -> None:
+    label = f'{surface}_{config}'
+    print(f'\n=== {label} ===')
+
+    # Os nós não atravessam o pool de processos (cada worker tem sua própria
+    # sessão AiiDA), então só a pasta do DOS é carregada aqui; a do SCF e o
+    # misc Dict só são lidos se o E_F ainda não estiver disponível.
+    dos_folder = orm.load_node(pks['dos_retrieved_pk'])
+
+    dos = load_dos_arrays(dos_folder, out_dir / '.cache')
+
+    # Se SCF e DOS são o mesmo cálculo, o E_F do vasprun.xml já foi lido
+    vasprun_efermi = None
+    if pks['scf_retrieved_pk'] == pks['dos_retrieved_pk'] and not np.isnan(dos['efermi']):
+        vasprun_efermi = dos['efermi']
+    efermi = get_efermi(pks['scf_misc_pk'], pks['scf_retrieved_pk'],
+                        pks.get('scf_efermi'), vasprun_efermi)
+    print(f'  E_fermi (SCF) = {efermi:.4f} eV')
+
+    energies = dos['energies'] - efermi
+    is_spin = dos['is_spin']
+
+    fig, ax = _pdos_axes()
+
+    # Janela de energia para calcular os limites do eixo y. As energias
+    # do VASP são crescentes: um slice (view) evita copiar cada curva
+    # como faria uma máscara booleana.
+    e_lo, e_hi = ENERGY_RANGE
+    i_lo = np.searchsorted(energies, e_lo, side='left')
+    i_hi = np.searchsorted(energies, e_hi, side='right')
+    window = slice(i_lo, i_hi)
+    # Só a janela (mais um ponto de cada lado, para a curva chegar às
+    # bordas do eixo) é enviada ao matplotlib: o Agg desenha O(janela)
+    # pontos em vez do DOS inteiro. O CSV continua com todos os pontos.
+    plot = slice(max(i_lo - 1, 0), i_hi + 1)
+    e_plot = energies[plot]
+
+    # TDOS (fundo semitransparente)
+    tdos_up = dos['tdos_up']
+    tdos_dn = dos['tdos_dn']
+    ax.fill_between(e_plot,  tdos_up[plot],  color='lightgray', alpha=0.5,
+                    label='TDOS')
+    if is_spin:
+        ax.fill_between(e_plot, -tdos_dn[plot], color='lightgray', alpha=0.5)
+
+    csv_data: dict = {'Energy_eV': energies}
+    peak_pos = 0.0   # maior valor positivo dentro da janela
+    peak_neg = 0.0   # maior valor absoluto negativo dentro da janela
+
+    for symbol in dos['elements']:
+        color = ELEMENT_COLORS.get(symbol)
+        up = dos[f'{symbol}_up']
+        dn = dos[f'{symbol}_dn']
+
+        ax.plot(e_plot,  up[plot], color=color, lw=1.8,
+                label=f'{symbol} ↑' if is_spin else symbol)
         if is_spin:
-            ax.fill_between(energies, -tdos_dn, color='lightgray', alpha=0.5)
-
-        # Máscara da janela de energia para calcular os limites do eixo y
-        e_lo, e_hi = ENERGY_RANGE
-        mask = (energies >= e_lo) & (energies <= e_hi)
-
-        csv_data: dict = {'Energy_eV': energies}
-        peak_pos = 0.0   # maior valor positivo dentro da janela
-        peak_neg = 0.0   # maior valor absoluto negativo dentro da janela
-
-        for elem in elements:
-            color = ELEMENT_COLORS.get(elem.symbol)
-            dos_obj = element_dos[elem]
-            up = dos_obj.densities.get(Spin.up, np.zeros_like(energies))
-            dn = dos_obj.densities.get(Spin.down, np.zeros_like(energies))
-
-            ax.plot(energies,  up, color=color, lw=1.8,
-                    label=f'{elem.symbol} ↑' if is_spin else elem.symbol)
-            if is_spin:
-                ax.plot(energies, -dn, color=color, lw=1.8, ls='--',
-                        label=f'{elem.symbol} ↓')
-
-            # Picos dentro da janela
-            peak_pos = max(peak_pos, float(np.max(up[mask])))
-            if is_spin:
-                peak_neg = max(peak_neg, float(np.max(dn[mask])))
-
-            csv_data[f'{elem.symbol}_up'] = up
-            if is_spin:
-                csv_data[f'{elem.symbol}_dn'] = dn
-
-        # Inclui também o TDOS na estimativa dos limites
-        peak_pos = max(peak_pos, float(np.max(tdos_up[mask])))
+            ax.plot(e_plot, -dn[plot], color=color, lw=1.8, ls='--',
+                    label=f'{symbol} ↓')
+
+        # Picos dentro da janela
+        peak_pos = max(peak_pos, float(np.max(up[window])))
+        if is_spin:
+            peak_neg = max(peak_neg, float(np.max(dn[window])))
+
+        csv_data[f'{symbol}_up'] = up
         if is_spin:
-            peak_neg = max(peak_neg, float(np.max(tdos_dn[mask])))
-
-        ax.axvline(0, color='black', ls='--', lw=1.2, alpha=0.7)
-        ax.axhline(0, color='black', lw=0.8, alpha=0.5)
-
-        ax.set_xlim(ENERGY_RANGE)
-        y_max = peak_pos * 1.10
-        y_min = -peak_neg * 1.10 if is_spin else 0.0
-        ax.set_ylim(y_min, y_max)
-        ax.set_xlabel('$E - E_F$ (eV)', fontsize=15)
-        ax.set_ylabel('DOS (states/eV)' + (' ↑ / ↓' if is_spin else ''),
-                      fontsize=15)
-        ax.text(0.02, 0.97, '$E_F = 0$ eV', transform=ax.transAxes,
-                fontsize=12, va='top',
-                bbox=dict(facecolor='white', alpha=0.8, boxstyle='round,pad=0.3'))
-        ax.legend(loc='upper right', fontsize=11, framealpha=0.9,
-                  edgecolor='gray', ncol=2 if is_spin else 1)
-
-        fig.tight_layout()
-        out_prefix = out_dir / f'{label}_pdos'
-        fig.savefig(f'{out_prefix}.png', dpi=300, bbox_inches='tight')
-        fig.savefig(f'{out_prefix}.pdf', bbox_inches='tight')
-        plt.close(fig)
-
-        df = pd.DataFrame(csv_data)
-        df.to_csv(f'{out_prefix}.csv', index=False)
-        print(f'  Salvo: {out_prefix}.png / .pdf / .csv')
+            csv_data[f'{symbol}_dn'] = dn
+
+    # Inclui também o TDOS na estimativa dos limites
+    peak_pos = max(peak_pos, float(np.max(tdos_up[window])))
+    if is_spin:
+        peak_neg = max(peak_neg, float(np.max(tdos_dn[window])))
+
+    ax.axvline(0, color='black', ls='--', lw=1.2, alpha=0.7)
+    ax.axhline(0, color='black', lw=0.8, alpha=0.5)
+
+    ax.set_xlim(ENERGY_RANGE)
+    y_max = peak_pos * 1.10
+    y_min = -peak_neg * 1.10 if is_spin else 0.0
+    ax.set_ylim(y_min, y_max)
+    ax.set_xlabel('$E - E_F$ (eV)', fontsize=15)
+    ax.set_ylabel('DOS (states/eV)' + (' ↑ / ↓' if is_spin else ''),
+                  fontsize=15)
+    ax.text(0.02, 0.97, '$E_F = 0$ eV', transform=ax.transAxes,
+            fontsize=12, va='top',
+            bbox=dict(facecolor='white', alpha=0.8, boxstyle='round,pad=0.3'))
+    ax.legend(loc='upper right', fontsize=11, framealpha=0.9,
+              edgecolor='gray', ncol=2 if is_spin else 1)
+
+    fig.tight_layout()
+    out_prefix = out_dir / f'{label}_pdos'
+    fig.savefig(f'{out_prefix}.png', dpi=300, bbox_inches='tight')
+    fig.savefig(f'{out_prefix}.pdf', bbox_inches='tight')
+
+    # Colunas na ordem de inserção, gravadas direto do ndarray; %.17g
+    # preserva o float64 exato, como o CSV do pandas
+    np.savetxt(f'{out_prefix}.csv', np.column_stack(list(csv_data.values())),
+               delimiter=',', header=','.join(csv_data), comments='',
+               fmt='%.17g')
+    print(f'  Salvo: {out_prefix}.png / .pdf / .csv')
 
 # ---------------------------------------------------------------------------
 # Main
@@ -239,11 +421,23 @@ def main() -> None:
     print(f'  Encontrados {len(calcs)} cálculos DOS: '
           f'{sorted(calcs.keys())}')
 
-    for (surface, config), pks in sorted(calcs.items()):
-        try:
-            plot_pdos(surface, config, pks, out_dir)
-        except Exception as exc:
-            print(f'  ERRO em {surface}_{config}: {exc}')
+    # Cada cálculo é independente (leitura do vasprun.xml + gráfico): um
+    # processo por cálculo. 'spawn' evita herdar a conexão do banco do
+    # processo principal; cada worker carrega o perfil no initializer.
+    with ProcessPoolExecutor(max_workers=MAX_WORKERS,
+                             mp_context=multiprocessing.get_context('spawn'),
+                             initializer=load_profile,
+                             initargs=(PROFILE,)) as executor:
+        futures = {
+            executor.submit(plot_pdos, surface, config, pks, out_dir): (surface, config)
+            for (surface, config), pks in sorted(calcs.items())
+        }
+        for future in as_completed(futures):
+            surface, config = futures[future]
+            try:
+                future.result()
+            except Exception as exc:
+                print(f'  ERRO em {surface}_{config}: {exc}')
 
     print('\nConcluído. Figuras em:', out_dir)
 
@@ -117,6 +117,41 @@ class TestAimdTrajectoryConcatenation:
         assert stepids.tolist() == [0, 1, 2, 3]
         assert combined.base.attributes.get('symbols') == ['H']
 
+    def test_promotes_dtype_across_stages(self):
+        """A wider dtype in a later stage should not be narrowed to the first stage's."""
+        parts = {}
+        for key, energies, temperatures in (
+            ('s01_equilibration', np.array([1, 2], dtype=np.int64), np.array([300, 301], dtype=np.float32)),
+            ('s02_production', np.array([2.5, 3.25], dtype=float), np.array([0.1, 0.2], dtype=np.float64)),
+        ):
+            traj = orm.TrajectoryData()
+            traj.set_trajectory(
+                symbols=['H'],
+                positions=np.zeros((2, 1, 3), dtype=float),
+                stepids=np.array([0, 1], dtype=int),
+            )
+            traj.set_array('energies', energies)
+            traj.set_array('temperatures', temperatures)
+            parts[key] = traj
+
+        wg = WorkGraph(name='test_concatenate_dtype_promotion')
+        wg.add_task(
+            concatenate_trajectories,
+            name='concatenate_trajectories',
+            trajectories=parts,
+        )
+        wg.run()
+
+        assert wg.tasks['concatenate_trajectories'].state == 'FINISHED'
+        combined = wg.tasks['concatenate_trajectories'].outputs.result.value
+        energies = combined.get_array('energies')
+        temperatures = combined.get_array('temperatures')
+
+        assert energies.dtype == np.float64
+        assert energies.tolist() == [1.0, 2.0, 2.5, 3.25]
+        assert temperatures.dtype == np.float64
+        assert temperatures[2:].tolist() == [0.1, 0.2]
+
     def test_ensure_cartesian_trajectory_converts_fractional_positions(self):
         """Fractional trajectory positions should be converted to Cartesian."""
         traj = orm.TrajectoryData()
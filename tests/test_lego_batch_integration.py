@@ -126,6 +126,20 @@ class TestBatchImport:
         assert merged['incar']['encut'] == 400
         assert merged['incar']['ismear'] == 0
 
+    def test_batch_merge_incar_flat_and_nested(self):
+        """merge_incar() matches deep_merge_dicts without mutating its inputs."""
+        from quantum_lego.core.common.utils import deep_merge_dicts, merge_incar
+
+        base = {'encut': 300, 'ismear': 0, 'ldau': {'U': [0, 4]}}
+        flat = {'encut': 400, 'nelect': 191.9}
+        nested = {'ldau': {'U': [0, 5]}}
+
+        assert merge_incar(base, flat) == deep_merge_dicts(base, flat)
+        assert merge_incar(base, nested) == deep_merge_dicts(base, nested)
+        assert merge_incar(base, {}) == base
+        assert merge_incar(base, {}) is not base
+        assert base == {'encut': 300, 'ismear': 0, 'ldau': {'U': [0, 4]}}
+
 
 @pytest.mark.tier2
 @pytest.mark.requires_aiida
@@ -158,6 +158,41 @@ class TestBrickRegistry:
             get_brick_module('')
 
 
+# ---------------------------------------------------------------------------
+# TestResolveStructureFrom
+# ---------------------------------------------------------------------------
+
+@pytest.mark.tier1
+class TestResolveStructureFrom:
+    """Tests for resolve_structure_from() static-stage handling."""
+
+    def _context(self, with_stage_configs=True):
+        stages = [{'name': 'scf', 'type': 'vasp', 'incar': {'nsw': 0}}]
+        context = {
+            'stage_tasks': {'scf': {'input_structure': 'scf-input-structure'}},
+            'stage_types': {'scf': 'vasp'},
+            'stages': stages,
+        }
+        if with_stage_configs:
+            context['stage_configs'] = {s['name']: s for s in stages}
+        return context
+
+    def test_static_vasp_stage_uses_input_structure(self):
+        from quantum_lego.core.bricks import resolve_structure_from
+        assert resolve_structure_from('scf', self._context()) == 'scf-input-structure'
+
+    def test_falls_back_to_stages_list_without_stage_configs(self):
+        from quantum_lego.core.bricks import resolve_structure_from
+        context = self._context(with_stage_configs=False)
+        assert resolve_structure_from('scf', context) == 'scf-input-structure'
+
+    def test_input_keyword_returns_input_structure(self):
+        from quantum_lego.core.bricks import resolve_structure_from
+        context = self._context()
+        context['input_structure'] = 'initial'
+        assert resolve_structure_from('input', context) == 'initial'
+
+
 # ---------------------------------------------------------------------------
 # TestVaspValidateStage
 # ---------------------------------------------------------------------------
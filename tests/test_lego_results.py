@@ -367,3 +367,42 @@ class TestPrintHubbardAnalysisStageResults:
         self._print(1, 'analysis', self._base_result())
         out = capsys.readouterr().out
         assert 'hubbard_analysis' in out.lower()
+
+
+# ---------------------------------------------------------------------------
+# TestGetSequentialResults
+# ---------------------------------------------------------------------------
+
+@pytest.mark.tier1
+class TestGetSequentialResults:
+    """Tests for quantum_lego.core.results.get_sequential_results()."""
+
+    def test_loads_workgraph_once_and_dispatches_per_stage_type(self, monkeypatch):
+        from types import SimpleNamespace
+
+        from quantum_lego.core import results
+        from quantum_lego.core.bricks import BRICK_REGISTRY
+
+        loaded = []
+        monkeypatch.setattr(results.orm, 'load_node', lambda pk: loaded.append(pk) or f'node{pk}')
+
+        def fake_brick(label):
+            return SimpleNamespace(get_stage_results=lambda wg_node, wg_pk, name, ns: (
+                label, wg_node, name, ns,
+            ))
+
+        monkeypatch.setitem(BRICK_REGISTRY, 'vasp', fake_brick('vasp'))
+        monkeypatch.setitem(BRICK_REGISTRY, 'dos', fake_brick('dos'))
+
+        out = results.get_sequential_results({
+            '__workgraph_pk__': 7,
+            '__stage_names__': ['relax', 'dos'],
+            '__stage_types__': {'dos': 'dos'},
+            '__stage_namespaces__': {'relax': {'main': 'stage1'}},
+        })
+
+        assert loaded == [7]
+        assert out == {
+            'relax': ('vasp', 'node7', 'relax', {'main': 'stage1'}),
+            'dos': ('dos', 'node7', 'dos', None),
+        }
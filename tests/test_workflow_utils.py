@@ -27,6 +27,10 @@ class TestBuildIndexedOutputName:
         from quantum_lego.core.workflow_utils import _build_indexed_output_name
         assert _build_indexed_output_name(3, 'md_production_0') == 's03_md_production_0'
 
+    def test_three_digit_index(self):
+        from quantum_lego.core.workflow_utils import _build_indexed_output_name
+        assert _build_indexed_output_name(100, 'scf') == 's100_scf'
+
 
 @pytest.mark.tier1
 class TestBuildCombinedTrajectoryOutputName:
@@ -51,7 +55,20 @@ class TestValidateStages:
 
     def _validate(self, stages):
         from quantum_lego.core.workflow_utils import _validate_stages
-        _validate_stages(stages)
+        return _validate_stages(stages)
+
+    def test_returns_type_and_brick_per_stage(self):
+        from quantum_lego.core.bricks import BRICK_REGISTRY
+
+        stages = [
+            {'name': 'relax', 'incar': {'NSW': 100}, 'restart': None},
+            {'name': 'dos_calc', 'type': 'dos', 'scf_incar': {'encut': 400},
+             'dos_incar': {'nedos': 2000}, 'structure_from': 'relax'},
+        ]
+        assert self._validate(stages) == [
+            ('vasp', BRICK_REGISTRY['vasp']),
+            ('dos', BRICK_REGISTRY['dos']),
+        ]
 
     def test_empty_stages_raises(self):
         with pytest.raises(ValueError, match="empty"):
@@ -139,6 +156,174 @@ class TestValidateStages:
             self._validate(stages)
 
 
+@pytest.mark.tier2
+@pytest.mark.requires_aiida
+class TestLoadStructure:
+    """Tests for _load_structure() argument handling."""
+
+    def test_structure_node_returned_as_is(self, si_diamond_structure):
+        from quantum_lego.core.workflow_utils import _load_structure
+        assert _load_structure(si_diamond_structure) is si_diamond_structure
+
+    def test_other_inputs_passed_through(self):
+        from quantum_lego.core.workflow_utils import _load_structure, _load_structures
+        assert _load_structure('Si.vasp') == 'Si.vasp'
+        assert _load_structures({'a': 'Si.vasp'}) == {'a': 'Si.vasp'}
+
+    def test_load_structures_resolves_pks_in_order(self, skip_without_aiida, si_diamond_structure):
+        from quantum_lego.core.workflow_utils import _load_structures
+
+        stored = si_diamond_structure.clone().store()
+        unstored = si_diamond_structure.clone()
+
+        nodes = _load_structures({'b': stored.pk, 'a': unstored, 'c': stored.pk})
+
+        assert list(nodes) == ['b', 'a', 'c']
+        assert nodes['b'].pk == stored.pk
+        assert nodes['a'] is unstored
+        assert nodes['c'] is nodes['b']
+
+    def test_load_structures_missing_pk_raises(self, skip_without_aiida):
+        from aiida.common.exceptions import NotExistent
+        from quantum_lego.core.workflow_utils import _load_structures
+
+        with pytest.raises(NotExistent):
+            _load_structures({'a': 10**9})
+
+
+@pytest.mark.tier2
+@pytest.mark.requires_aiida
+class TestBuilderToDict:
+    """Tests for _builder_to_dict() namespace flattening."""
+
+    def test_nested_namespaces_converted_and_empty_ones_dropped(self, skip_without_aiida):
+        from aiida import orm
+        from aiida.plugins import CalculationFactory
+        from quantum_lego.core.workflow_utils import _builder_to_dict
+
+        builder = CalculationFactory('core.arithmetic.add').get_builder()
+        x = orm.Int(1)
+        builder.x = x
+        builder.metadata.options.resources = {'num_machines': 1}
+
+        assert _builder_to_dict(builder) == {
+            'metadata': {'options': {'resources': {'num_machines': 1}}},
+            'x': x,
+        }
+
+    def test_unset_builder_is_empty(self, skip_without_aiida):
+        from aiida.plugins import CalculationFactory
+        from quantum_lego.core.workflow_utils import _builder_to_dict
+
+        assert _builder_to_dict(CalculationFactory('core.arithmetic.add').get_builder()) == {}
+
+
+@pytest.mark.tier2
+@pytest.mark.requires_aiida
+class TestPrepareBuilderInputs:
+    """Tests for _prepare_builder_inputs() selective dynamics."""
+
+    def test_bottom_fixed_atoms_get_false_dof(self, si_diamond_structure):
+        from quantum_lego.core.workflow_utils import _prepare_builder_inputs
+
+        prepared = _prepare_builder_inputs(
+            incar={'nsw': 0},
+            kpoints_spacing=0.03,
+            potential_family='PBE',
+            potential_mapping={},
+            options={},
+            structure=si_diamond_structure,
+            fix_type='bottom',
+            fix_thickness=0.5,
+        )
+
+        assert prepared['dynamics'].get_dict()['positions_dof'] == [
+            [False, False, False],
+            [True, True, True],
+        ]
+
+    def test_dict_nodes_cache_shares_equal_inputs(self):
+        from quantum_lego.core.workflow_utils import _prepare_builder_inputs
+
+        dict_nodes = {}
+        common = dict(
+            kpoints_spacing=0.03,
+            potential_family='PBE',
+            potential_mapping={'Si': 'Si'},
+            options={'resources': {'num_machines': 1}},
+            dict_nodes=dict_nodes,
+        )
+        first = _prepare_builder_inputs(incar={'encut': 400}, **common)
+        second = _prepare_builder_inputs(incar={'encut': 400}, **common)
+        third = _prepare_builder_inputs(incar={'encut': 500}, **common)
+
+        assert second['parameters'] is first['parameters']
+        assert third['parameters'] is not first['parameters']
+        assert third['options'] is first['options']
+        assert third['potential_mapping'] is first['potential_mapping']
+
+    def test_dict_nodes_cache_does_not_share_non_json_content(self):
+        import numpy as np
+        from quantum_lego.core.workflow_utils import _dict_node
+
+        dict_nodes = {}
+        # Long arrays have truncated reprs, so they must not be keyed by repr
+        first = np.zeros(2000)
+        second = first.copy()
+        second[1000] = 1.0
+
+        assert _dict_node({'a': first}, dict_nodes) is not _dict_node({'a': second}, dict_nodes)
+        assert dict_nodes == {}
+
+    def test_dict_nodes_cache_shares_equal_kpoints_meshes(self):
+        from quantum_lego.core.workflow_utils import _prepare_builder_inputs
+
+        dict_nodes = {}
+        common = dict(
+            incar={'encut': 400},
+            kpoints_spacing=0.03,
+            potential_family='PBE',
+            potential_mapping={},
+            options={},
+            dict_nodes=dict_nodes,
+        )
+        first = _prepare_builder_inputs(kpoints_mesh=[4, 4, 1], **common)
+        second = _prepare_builder_inputs(kpoints_mesh=(4, 4, 1), **common)
+        third = _prepare_builder_inputs(kpoints_mesh=[6, 6, 1], **common)
+
+        assert second['kpoints'] is first['kpoints']
+        assert third['kpoints'] is not first['kpoints']
+        assert first['kpoints'].get_kpoints_mesh()[0] == [4, 4, 1]
+
+
+@pytest.mark.tier1
+class TestGetTaskClass:
+    """Tests for _get_task_class() memoization."""
+
+    def test_same_entry_point_returns_same_task(self):
+        from quantum_lego.core.workflow_utils import _get_task_class
+        assert _get_task_class('vasp.v2.vasp') is _get_task_class('vasp.v2.vasp')
+
+
+@pytest.mark.tier1
+class TestLoadCode:
+    """Tests for _load_code() per-graph caching."""
+
+    def test_codes_cache_is_scoped_to_the_caller(self, monkeypatch):
+        from aiida import orm
+        from quantum_lego.core.workflow_utils import _load_code
+
+        loaded = []
+        monkeypatch.setattr(orm, 'load_code', lambda label: loaded.append(label) or object())
+
+        codes = {}
+        assert _load_code('vasp@local', codes) is _load_code('vasp@local', codes)
+        assert loaded == ['vasp@local']
+        # Without a cache every call queries again
+        assert _load_code('vasp@local') is not _load_code('vasp@local')
+        assert loaded == ['vasp@local'] * 3
+
+
 @pytest.mark.tier1
 class TestBackwardCompatImports:
     """Tests that importing from workgraph.py still works (facade compatibility)."""
@@ -253,3 +438,364 @@ class TestDosWrappers:
         assert stage['structure'] == 'dummy-structure'
         assert stage['scf_incar']['lwave'] is True
         assert stage['scf_incar']['lcharg'] is True
+
+    def test_dos_batch_incar_helpers_copy_and_fill_defaults(self):
+        from quantum_lego.core.dos_workflows import _dos_batch_dos_incar, _dos_batch_scf_incar
+
+        scf_incar = {'encut': 400, 'ibrion': 2}
+        scf_final = _dos_batch_scf_incar(scf_incar)
+        assert scf_final == {
+            'encut': 400, 'ibrion': 2, 'lwave': True, 'lcharg': True, 'nsw': 0,
+        }
+        assert scf_incar == {'encut': 400, 'ibrion': 2}
+
+        dos_incar = {'nedos': 2000, 'nsw': 5}
+        assert _dos_batch_dos_incar(dos_incar) == {'nedos': 2000, 'nsw': 5, 'ibrion': -1}
+        assert dos_incar == {'nedos': 2000, 'nsw': 5}
+
+
+@pytest.mark.tier1
+class TestVaspSequentialBuilder:
+    """Tests for make_vasp_sequential_builder() INCAR sweeps."""
+
+    def _make_builder(self, monkeypatch, captured):
+        from quantum_lego.core import vasp_workflows
+
+        validate_calls = []
+
+        def fake_submit(**kwargs):
+            captured.append(kwargs)
+            return {'__workgraph_pk__': len(captured)}
+
+        monkeypatch.setattr(vasp_workflows, '_load_code', lambda label: f'code:{label}')
+        monkeypatch.setattr(
+            vasp_workflows, '_validate_stages', lambda stages: validate_calls.append(stages),
+        )
+        monkeypatch.setattr(vasp_workflows, '_submit_vasp_sequential', fake_submit)
+
+        stages = [
+            {'name': 'relax', 'incar': {'ENCUT': 400, 'NSW': 100}, 'restart': None},
+            {'name': 'scf', 'incar': {'encut': 400, 'nsw': 0}, 'restart': 'relax'},
+        ]
+        build = vasp_workflows.make_vasp_sequential_builder(
+            stages=stages,
+            code_label='dummy-code',
+            options={'resources': {'num_machines': 1}},
+        )
+        return build, stages, validate_calls
+
+    def test_patches_existing_incar_keys_and_revalidates(self, monkeypatch):
+        captured = []
+        build, stages, validate_calls = self._make_builder(monkeypatch, captured)
+
+        build('dummy-structure')
+        build('dummy-structure', incar_overrides={'ENCUT': 500})
+        build('dummy-structure', incar_overrides={'encut': 550, 'NSW': 50})
+
+        # Once up front, then once per build() that patched INCAR values
+        assert len(validate_calls) == 3
+        captured = captured[1:]
+        assert captured[0]['code'] == 'code:dummy-code'
+        assert captured[0]['stages'][0]['incar'] == {'ENCUT': 500, 'NSW': 100}
+        assert captured[0]['stages'][1]['incar'] == {'encut': 500, 'nsw': 0}
+        assert captured[1]['stages'][0]['incar'] == {'ENCUT': 550, 'NSW': 50}
+        assert captured[1]['stages'][1]['incar'] == {'encut': 550, 'nsw': 50}
+        # The caller's stage list is left untouched.
+        assert stages[0]['incar'] == {'ENCUT': 400, 'NSW': 100}
+
+    def test_each_build_gets_its_own_stage_copy(self, monkeypatch):
+        captured = []
+        build, stages, _ = self._make_builder(monkeypatch, captured)
+
+        build('dummy-structure')
+        # Bricks may rebind or edit the INCAR of the stages they receive
+        captured[0]['stages'][0]['incar']['ENCUT'] = 999
+        build('dummy-structure')
+
+        assert captured[1]['stages'][0]['incar'] == {'ENCUT': 400, 'NSW': 100}
+        assert stages[0]['incar'] == {'ENCUT': 400, 'NSW': 100}
+
+    def test_patches_composite_incar_fields(self, monkeypatch):
+        from quantum_lego.core import vasp_workflows
+
+        captured = []
+        monkeypatch.setattr(vasp_workflows, '_load_code', lambda label: label)
+        monkeypatch.setattr(vasp_workflows, '_validate_stages', lambda stages: None)
+        monkeypatch.setattr(
+            vasp_workflows, '_submit_vasp_sequential', lambda **kwargs: captured.append(kwargs),
+        )
+        build = vasp_workflows.make_vasp_sequential_builder(
+            stages=[
+                {'name': 'relax', 'incar': {'encut': 400}, 'restart': None},
+                {'name': 'dos', 'type': 'dos', 'structure_from': 'relax',
+                 'scf_incar': {'ENCUT': 400}, 'dos_incar': {'encut': 400, 'nedos': 3000}},
+            ],
+            code_label='dummy-code',
+            options={'resources': {'num_machines': 1}},
+        )
+
+        build('dummy-structure', incar_overrides={'ENCUT': 520})
+
+        dos_stage = captured[0]['stages'][1]
+        assert dos_stage['scf_incar'] == {'ENCUT': 520}
+        assert dos_stage['dos_incar'] == {'encut': 520, 'nedos': 3000}
+
+    def test_overrides_are_checked_by_brick_validation(self, monkeypatch):
+        from quantum_lego.core import vasp_workflows
+
+        captured = []
+        monkeypatch.setattr(vasp_workflows, '_load_code', lambda label: label)
+        monkeypatch.setattr(
+            vasp_workflows, '_submit_vasp_sequential', lambda **kwargs: captured.append(kwargs),
+        )
+        build = vasp_workflows.make_vasp_sequential_builder(
+            stages=[
+                {'name': 'vib', 'incar': {'ibrion': 5, 'nsw': 1, 'nwrite': 3}, 'restart': None},
+                {'name': 'dimer', 'type': 'dimer', 'vibrational_from': 'vib',
+                 'incar': {'IBRION': 44, 'nsw': 100}, 'restart': None},
+            ],
+            code_label='dummy-code',
+            options={'resources': {'num_machines': 1}},
+        )
+
+        build('dummy-structure', incar_overrides={'NSW': 200})
+        with pytest.raises(ValueError, match='IBRION=44'):
+            build('dummy-structure', incar_overrides={'IBRION': 2})
+        assert len(captured) == 1
+
+    def test_unknown_incar_key_raises(self, monkeypatch):
+        captured = []
+        build, _, _ = self._make_builder(monkeypatch, captured)
+
+        with pytest.raises(ValueError, match='not set by any stage'):
+            build('dummy-structure', incar_overrides={'ISMEAR': 0})
+        assert captured == []
+
+
+@pytest.mark.tier1
+class TestWaitForCompletion:
+    """Tests for _wait_for_completion() polling and broadcast wake-up."""
+
+    def test_polls_until_terminal_without_broker(self, monkeypatch):
+        from quantum_lego.core import workflow_utils
+
+        statuses = iter(['waiting', 'running', 'finished'])
+        monkeypatch.setattr(workflow_utils, 'get_status', lambda pk: next(statuses))
+        monkeypatch.setattr(workflow_utils, '_subscribe_to_termination', lambda pk, cb: None)
+
+        workflow_utils._wait_for_completion(1, poll_interval=0.0)
+
+        assert next(statuses, None) is None
+
+    def test_polling_backs_off_and_resets_on_status_change(self, monkeypatch):
+        from quantum_lego.core import workflow_utils
+
+        statuses = iter(['running', 'running', 'running', 'waiting', 'finished'])
+        waits = []
+
+        class RecordingEvent:
+            def set(self):
+                pass
+
+            def wait(self, timeout):
+                waits.append(timeout)
+                return False
+
+        monkeypatch.setattr(workflow_utils, 'get_status', lambda pk: next(statuses))
+        monkeypatch.setattr(workflow_utils, '_subscribe_to_termination', lambda pk, cb: None)
+        monkeypatch.setattr(workflow_utils.threading, 'Event', RecordingEvent)
+
+        workflow_utils._wait_for_completion(1, poll_interval=2.0, max_interval=4.0)
+
+        assert waits == [2.0, 3.0, 4.0, 2.0]
+
+    def test_broadcast_wakes_waiter_and_unsubscribes(self, monkeypatch):
+        import threading
+
+        from quantum_lego.core import workflow_utils
+
+        state = {'status': 'running', 'unsubscribed': False}
+
+        def fake_subscribe(pk, callback):
+            def finish():
+                state['status'] = 'finished'
+                callback()
+            threading.Timer(0.05, finish).start()
+            return lambda: state.update(unsubscribed=True)
+
+        monkeypatch.setattr(workflow_utils, 'get_status', lambda pk: state['status'])
+        monkeypatch.setattr(workflow_utils, '_subscribe_to_termination', fake_subscribe)
+
+        # A poll interval this long would time the test out if the broadcast
+        # did not wake the waiter.
+        workflow_utils._wait_for_completion(1, poll_interval=3600.0)
+
+        assert state['unsubscribed'] is True
+
+
+@pytest.mark.tier2
+@pytest.mark.requires_aiida
+class TestGetBatchResultsFromWorkgraph:
+    """Tests for get_batch_results_from_workgraph() output collection."""
+
+    def _add_output(self, process, label, node):
+        from aiida.common.links import LinkType
+        node.base.links.add_incoming(process, LinkType.CREATE, label)
+        node.store()
+        return node
+
+    def _add_task(self, wg_node, task_name):
+        from aiida import orm
+        from aiida.common.links import LinkType
+        process = orm.CalcFunctionNode()
+        process.base.links.add_incoming(wg_node, LinkType.CALL_CALC, task_name)
+        process.store()
+        return process
+
+    def test_collects_outputs_of_all_tasks(self, skip_without_aiida, si_diamond_structure):
+        from aiida import orm
+        from quantum_lego.core.workflow_utils import get_batch_results_from_workgraph
+
+        wg_node = orm.WorkflowNode().store()
+        vasp_a = self._add_task(wg_node, 'vasp_a')
+        self._add_output(vasp_a, 'misc', orm.Dict({'total_energies': {'energy_extrapolated': -2.0}}))
+        structure = self._add_output(vasp_a, 'structure', si_diamond_structure)
+        energy_a = self._add_task(wg_node, 'energy_a')
+        self._add_output(energy_a, 'result', orm.Float(-1.5))
+        # Task b has only finished its VASP step
+        vasp_b = self._add_task(wg_node, 'vasp_b')
+        self._add_output(vasp_b, 'misc', orm.Dict({'total_energies': {'energy_extrapolated': -3.0}}))
+
+        results = get_batch_results_from_workgraph({
+            '__workgraph_pk__': wg_node.pk,
+            '__task_map__': {
+                'a': {'vasp_task': 'vasp_a', 'energy_task': 'energy_a'},
+                'b': {'vasp_task': 'vasp_b', 'energy_task': 'energy_b'},
+                'c': {'vasp_task': 'vasp_c', 'energy_task': 'energy_c'},
+            },
+        })
+
+        assert results['a']['energy'] == -1.5
+        assert results['a']['structure'].pk == structure.pk
+        assert results['b']['energy'] == -3.0
+        assert results['b']['structure'] is None
+        assert results['c'] == {
+            'energy': None, 'structure': None, 'misc': None, 'files': None,
+            'pk': wg_node.pk, 'key': 'c',
+        }
+
+    def test_reuses_query_only_for_sealed_workgraph(self, skip_without_aiida, monkeypatch):
+        from aiida import orm
+        from quantum_lego.core import workflow_utils
+
+        calls = []
+        query = workflow_utils._query_task_outputs
+
+        def counting_query(*args):
+            calls.append(args)
+            return query(*args)
+
+        monkeypatch.setattr(workflow_utils, '_query_task_outputs', counting_query)
+        monkeypatch.setattr(workflow_utils, '_SEALED_TASK_OUTPUTS', type(workflow_utils._SEALED_TASK_OUTPUTS)())
+
+        wg_node = orm.WorkflowNode().store()
+        vasp_a = self._add_task(wg_node, 'vasp_a')
+        self._add_output(vasp_a, 'misc', orm.Dict({'total_energies': {'energy_extrapolated': -2.0}}))
+        batch_result = {
+            '__workgraph_pk__': wg_node.pk,
+            '__task_map__': {'a': {'vasp_task': 'vasp_a', 'energy_task': 'energy_a'}},
+        }
+
+        workflow_utils.get_batch_results_from_workgraph(batch_result)
+        workflow_utils.get_batch_results_from_workgraph(batch_result)
+        assert len(calls) == 2
+
+        wg_node.seal()
+        first = workflow_utils.get_batch_results_from_workgraph(batch_result)
+        first['a']['misc']['total_energies'] = None
+        second = workflow_utils.get_batch_results_from_workgraph(batch_result)
+        assert len(calls) == 3
+        assert second['a']['energy'] == -2.0
+        assert second['a']['misc']['total_energies'] == {'energy_extrapolated': -2.0}
+
+
+@pytest.mark.tier1
+class TestLazyWorkgraphFacade:
+    """Tests for the lazily imported workflow builders."""
+
+    def test_result_helpers_do_not_import_workflow_modules(self):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from quantum_lego import get_results\n"
+            "assert 'quantum_lego.core.vasp_workflows' not in sys.modules\n"
+            "from quantum_lego import quick_vasp\n"
+            "from quantum_lego.core.workgraph import _prepare_builder_inputs\n"
+            "assert 'quantum_lego.core.vasp_workflows' in sys.modules\n"
+        )
+        subprocess.run([sys.executable, '-c', code], check=True)
+
+
+@pytest.mark.tier1
+class TestBuildVaspRetrieve:
+    """Tests for build_vasp_retrieve() merging and caching."""
+
+    def test_extra_files_appended_once_and_result_is_a_fresh_list(self):
+        from quantum_lego.core.retrieve_defaults import DEFAULT_VASP_RETRIEVE, build_vasp_retrieve
+
+        first = build_vasp_retrieve(['CHGCAR', 'OUTCAR'], extra=['DOSCAR', 'CHGCAR'])
+        assert first == [*DEFAULT_VASP_RETRIEVE, 'CHGCAR', 'DOSCAR']
+
+        first.append('WAVECAR')
+        assert build_vasp_retrieve(['CHGCAR', 'OUTCAR'], extra=['DOSCAR', 'CHGCAR']) == [
+            *DEFAULT_VASP_RETRIEVE, 'CHGCAR', 'DOSCAR',
+        ]
+
+
+@pytest.mark.tier2
+@pytest.mark.requires_aiida
+class TestQuickDosBatch:
+    """Tests for quick_dos_batch() graph construction."""
+
+    def test_duplicate_structures_share_one_scf_task(self, monkeypatch, si_diamond_structure):
+        from aiida_workgraph import WorkGraph
+        from quantum_lego.core import dos_workflows
+
+        built = []
+        monkeypatch.setattr(dos_workflows, '_load_code', lambda label: None)
+        monkeypatch.setattr(WorkGraph, 'submit', lambda self, *args, **kwargs: built.append(self))
+
+        result = dos_workflows.quick_dos_batch(
+            structures={'a': si_diamond_structure, 'b': si_diamond_structure, 'c': si_diamond_structure},
+            code_label='dummy-code',
+            scf_incar={'encut': 400},
+            dos_incar={'nedos': 2000},
+            scf_incar_overrides={'c': {'encut': 500}},
+            options={'resources': {'num_machines': 1}},
+        )
+
+        task_map = result['__task_map__']
+        assert task_map['a'] == {'scf_task': 'scf_a', 'dos_task': 'dos_a'}
+        assert task_map['b'] == {'scf_task': 'scf_a', 'dos_task': 'dos_b'}
+        assert task_map['c'] == {'scf_task': 'scf_c', 'dos_task': 'dos_c'}
+        task_names = {task.name for task in built[0].tasks}
+        assert {'scf_a', 'scf_c', 'dos_a', 'dos_b', 'dos_c'} <= task_names
+        assert 'scf_b' not in task_names
+        # The omitted potential_mapping is one node shared by every task
+        mappings = {
+            id(task.inputs.potential_mapping.value)
+            for task in built[0].tasks if task.name.startswith(('scf_', 'dos_'))
+        }
+        assert len(mappings) == 1
+
+    def test_scf_signature_uses_incar_contents(self, si_diamond_structure):
+        import numpy as np
+        from quantum_lego.core.dos_workflows import _dos_batch_scf_signature
+
+        signature = _dos_batch_scf_signature(si_diamond_structure, {'encut': 400, 'nsw': 0}, 0.03)
+
+        assert _dos_batch_scf_signature(si_diamond_structure, {'nsw': 0, 'encut': 400}, 0.03) == signature
+        assert _dos_batch_scf_signature(si_diamond_structure, {'encut': 400, 'nsw': 0}, 0.02) != signature
+        assert _dos_batch_scf_signature(si_diamond_structure, {'magmom': np.ones(2)}, 0.03) is None